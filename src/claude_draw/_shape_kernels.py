@@ -0,0 +1,103 @@
+"""Scalar geometry kernels shared by the shape primitives.
+
+Each kernel takes plain floats instead of model instances, so the hot
+arithmetic runs without attribute lookups or intermediate Point2D objects.
+Kernels built only from arithmetic and comparison operators work
+element-wise on NumPy arrays as well.
+"""
+
+import math
+
+_PI = math.pi
+_sqrt = math.sqrt
+
+
+def circle_contains(cx: float, cy: float, r: float, px: float, py: float) -> bool:
+    """Check whether a point lies inside or on a circle.
+
+    Compares squared distances, so no square root is taken.
+
+    Args:
+        cx: Center x coordinate
+        cy: Center y coordinate
+        r: Radius
+        px: Point x coordinate
+        py: Point y coordinate
+
+    Returns:
+        bool: True if the point is inside or on the boundary
+    """
+    dx = px - cx
+    dy = py - cy
+    return dx * dx + dy * dy <= r * r
+
+
+def ellipse_contains(
+    cx: float, cy: float, rx: float, ry: float, px: float, py: float
+) -> bool:
+    """Check whether a point lies inside or on an axis-aligned ellipse.
+
+    Args:
+        cx: Center x coordinate
+        cy: Center y coordinate
+        rx: Horizontal radius
+        ry: Vertical radius
+        px: Point x coordinate
+        py: Point y coordinate
+
+    Returns:
+        bool: True if the point is inside or on the boundary
+    """
+    dx = px - cx
+    dy = py - cy
+    return (dx * dx) / (rx * rx) + (dy * dy) / (ry * ry) <= 1.0
+
+
+def rectangle_contains(
+    x: float, y: float, width: float, height: float, px: float, py: float
+) -> bool:
+    """Check whether a point lies inside or on a rectangle.
+
+    Uses ``&`` rather than chained comparisons so that array inputs
+    produce an element-wise mask.
+
+    Args:
+        x: Left edge
+        y: Top edge
+        width: Rectangle width
+        height: Rectangle height
+        px: Point x coordinate
+        py: Point y coordinate
+
+    Returns:
+        bool: True if the point is inside or on the boundary
+    """
+    return (px >= x) & (px <= x + width) & (py >= y) & (py <= y + height)
+
+
+def ellipse_perimeter(rx: float, ry: float) -> float:
+    """Approximate an ellipse perimeter with Ramanujan's first formula.
+
+    Args:
+        rx: Horizontal radius
+        ry: Vertical radius
+
+    Returns:
+        float: π * (3(a+b) - sqrt((3a+b)(a+3b)))
+    """
+    return _PI * (3.0 * (rx + ry) - _sqrt((3.0 * rx + ry) * (rx + 3.0 * ry)))
+
+
+def segment_length(x0: float, y0: float, x1: float, y1: float) -> float:
+    """Length of the segment between two points.
+
+    Args:
+        x0: Start x coordinate
+        y0: Start y coordinate
+        x1: End x coordinate
+        y1: End y coordinate
+
+    Returns:
+        float: Euclidean distance, computed by math.hypot in one C call
+    """
+    return math.hypot(x1 - x0, y1 - y0)
@@ -18,10 +18,11 @@ The module implements several important design patterns:
 - Composition: Complex graphics built from simple primitives
 """
 
+import operator
+import os
 from abc import ABC, abstractmethod
-from typing import Any, Optional, List
-from uuid import uuid4
-from pydantic import Field, ConfigDict
+from typing import Any, Callable, Optional, List
+from pydantic import BaseModel, Field, ConfigDict
 
 from claude_draw.models.base import DrawModel
 from claude_draw.models.transform import Transform2D
@@ -29,6 +30,41 @@ from claude_draw.models.bounding_box import BoundingBox
 from claude_draw.models.color import Color
 
 
+def _new_id() -> str:
+    """Generate a random RFC 4122 version 4 UUID string.
+    
+    Produces the same format as ``str(uuid.uuid4())`` without building a
+    ``UUID`` object, which made id generation the single largest cost of
+    constructing a drawable.
+    
+    Returns:
+        str: Canonical 36-character UUID string
+    """
+    h = os.urandom(16).hex()
+    # Force the version nibble to 4 and the variant bits to 10xx
+    return f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{'89ab'[int(h[16], 16) & 3]}{h[17:20]}-{h[20:]}"
+
+
+# operator.itemgetter over each drawable class's field names, built on first
+# comparison. Used by Drawable.__eq__ to read all field values in one call.
+_FIELD_GETTERS: dict = {}
+
+
+def _field_getter(cls: type) -> Callable[[dict], tuple]:
+    """Build and remember a getter returning a model's field values as a tuple.
+    
+    Args:
+        cls: Model class
+        
+    Returns:
+        Callable[[dict], tuple]: Getter applied to an instance ``__dict__``
+    """
+    # Every drawable has several fields, so the getter always returns a tuple
+    getter = operator.itemgetter(*cls.model_fields)
+    _FIELD_GETTERS[cls] = getter
+    return getter
+
+
 class Drawable(DrawModel, ABC):
     """Abstract base class for all drawable objects in Claude Draw.
     
@@ -74,7 +110,7 @@ class Drawable(DrawModel, ABC):
     
     # Unique identifier for the drawable object, automatically generated
     id: str = Field(
-        default_factory=lambda: str(uuid4()), 
+        default_factory=_new_id, 
         description="Unique identifier for tracking and referencing this drawable"
     )
     
@@ -145,6 +181,28 @@ class Drawable(DrawModel, ABC):
         """
         ...
     
+    def __eq__(self, other: Any) -> bool:
+        """Compare two drawables by their field values.
+        
+        Pydantic's comparison also filters the instance ``__dict__`` and
+        checks private attributes and extra fields. Drawables forbid extra
+        fields and have no private attributes, so comparing the field tuples
+        directly gives the same answer in one step.
+        
+        Args:
+            other: Object to compare against
+            
+        Returns:
+            bool: True if both are the same drawable type with equal fields
+        """
+        if self is other:
+            return True
+        cls = type(self)
+        if type(other) is not cls:
+            return False if isinstance(other, BaseModel) else NotImplemented
+        getter = _FIELD_GETTERS.get(cls) or _field_getter(cls)
+        return getter(self.__dict__) == getter(other.__dict__)
+    
     def with_transform(self, transform: Transform2D) -> "Drawable":
         """Create a new instance with the specified transform.
         
@@ -634,7 +692,8 @@ class Container(Drawable, ABC):
                 
         Performance Note:
             This operation is O(n) where n is the number of direct children.
-            For deeply nested structures, consider caching bounds calculations.
+            The union is recomputed on every call, so it always reflects the
+            children's current geometry and each caller gets its own box.
         """
         if not self.children:
             # Empty container has zero bounds at origin
@@ -0,0 +1,115 @@
+"""Structure-of-arrays containers for bulk shape workloads.
+
+The shape classes in :mod:`claude_draw.shapes` are convenient one-at-a-time
+objects. Engines that process thousands of shapes can convert them once into
+a batch holding one contiguous NumPy array per field, then run bounds, area
+and hit-testing queries as whole-array operations.
+
+Requires the optional numpy dependency (``pip install 'claude-draw[numpy]'``).
+"""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Iterable
+
+from claude_draw import _shape_kernels
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+if TYPE_CHECKING:
+    from claude_draw.shapes import Circle
+
+
+@dataclass
+class CircleBatch:
+    """Many circles stored as parallel coordinate and radius arrays.
+
+    Attributes:
+        cx: Center x coordinates, shape (N,)
+        cy: Center y coordinates, shape (N,)
+        r: Radii, shape (N,)
+
+    Example:
+        >>> batch = CircleBatch.from_iter(drawing_circles)
+        >>> batch.bounds()[:, 2]  # widths of every bounding box
+        >>> hits = batch.contains_point(10.0, 20.0)
+    """
+
+    cx: Any
+    cy: Any
+    r: Any
+
+    def __post_init__(self) -> None:
+        """Convert the fields to float64 arrays and check their lengths.
+
+        Raises:
+            ImportError: If numpy is not installed
+            ValueError: If the arrays are not one-dimensional or differ in length
+        """
+        _require_numpy()
+        self.cx = np.asarray(self.cx, dtype=np.float64)
+        self.cy = np.asarray(self.cy, dtype=np.float64)
+        self.r = np.asarray(self.r, dtype=np.float64)
+        if self.cx.ndim != 1 or not (self.cx.shape == self.cy.shape == self.r.shape):
+            raise ValueError("cx, cy and r must be one-dimensional arrays of equal length")
+
+    @classmethod
+    def from_iter(cls, circles: Iterable["Circle"]) -> "CircleBatch":
+        """Build a batch from circle shapes.
+
+        Args:
+            circles: Circle instances to copy into the batch
+
+        Returns:
+            CircleBatch: Batch holding one row per circle, in input order
+
+        Raises:
+            ImportError: If numpy is not installed
+        """
+        _require_numpy()
+        rows = [(c.center.x, c.center.y, c.radius) for c in circles]
+        data = np.array(rows, dtype=np.float64).reshape(-1, 3)
+        return cls(cx=data[:, 0], cy=data[:, 1], r=data[:, 2])
+
+    def __len__(self) -> int:
+        """Number of circles in the batch."""
+        return len(self.r)
+
+    def areas(self) -> Any:
+        """Calculate the area of every circle.
+
+        Returns:
+            Array of areas, shape (N,)
+        """
+        return np.pi * self.r * self.r
+
+    def bounds(self) -> Any:
+        """Calculate the bounding box of every circle.
+
+        Returns:
+            Array of shape (N, 4) with columns x, y, width, height
+        """
+        diameter = 2.0 * self.r
+        return np.stack([self.cx - self.r, self.cy - self.r, diameter, diameter], axis=1)
+
+    def contains_point(self, x: float, y: float) -> Any:
+        """Hit-test one point against every circle.
+
+        Args:
+            x: Point x coordinate
+            y: Point y coordinate
+
+        Returns:
+            Boolean array of shape (N,), True for circles containing the point
+        """
+        return _shape_kernels.circle_contains(self.cx, self.cy, self.r, x, y)
+
+
+def _require_numpy() -> None:
+    """Raise a helpful error if the optional numpy dependency is missing."""
+    if np is None:
+        raise ImportError(
+            "numpy is required for shape batches; install 'claude-draw[numpy]'"
+        )
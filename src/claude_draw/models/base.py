@@ -170,6 +170,8 @@ class DrawModel(BaseModel):
                 - indent: Number of spaces for pretty-printing
                 - sort_keys: Whether to sort dictionary keys
                 - ensure_ascii: Whether to escape non-ASCII characters
+                - batch_children: Whether to write runs of same-type
+                  children in columnar form
             
         Returns:
             str: Enhanced JSON string with type information that can be
@@ -183,7 +185,7 @@ class DrawModel(BaseModel):
         """
         # Import here to avoid circular imports
         from claude_draw.serialization import serialize_drawable
-        return serialize_drawable(self, **kwargs)
+        return serialize_drawable(self, include_version=include_version, **kwargs)
     
     def to_dict_enhanced(self, include_version: bool = True) -> Dict[str, Any]:
         """Convert to dictionary with enhanced features including type discriminators.
@@ -213,6 +215,5 @@ class DrawModel(BaseModel):
             >>> # Can be used to reconstruct the exact object type later
         """
         # Import here to avoid circular imports
-        from claude_draw.serialization import EnhancedJSONEncoder
-        encoder = EnhancedJSONEncoder(include_version=include_version)
-        return encoder._serialize_draw_model(self)
\ No newline at end of file
+        from claude_draw.serialization import _enhanced_dict
+        return _enhanced_dict(self, include_version)
\ No newline at end of file
@@ -90,7 +90,7 @@ class BoundingBox(DrawModel):
         Returns:
             BoundingBox with zero dimensions
         """
-        return cls(x=0, y=0, width=0, height=0)
+        return cls(x=0.0, y=0.0, width=0.0, height=0.0)
     
     def is_empty(self) -> bool:
         """Check if the bounding box is empty.
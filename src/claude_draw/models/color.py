@@ -1,5 +1,7 @@
 """Color model for representing colors in various formats."""
 
+import re
+from functools import lru_cache
 from typing import Optional, Union, Self
 from pydantic import field_validator, model_validator
 
@@ -12,6 +14,36 @@ from claude_draw.models.validators import (
 )
 
 
+# Formatted "#RRGGBB" strings keyed by packed 24-bit RGB value. Drawings use
+# a small palette, so the table stays tiny; it stops growing at the limit.
+_HEX_STRINGS: dict[int, str] = {}
+_HEX_STRINGS_LIMIT = 4096
+
+
+# Six hex digits and nothing else; int(..., 16) alone also accepts a sign,
+# a 0x prefix, underscores and surrounding whitespace
+_HEX_DIGITS = re.compile(r"[0-9A-F]{6}")
+
+
+@lru_cache(maxsize=1024)
+def _hex_to_int(hex_string: str) -> int:
+    """Parse a hex color string into a packed 24-bit RGB integer.
+    
+    Args:
+        hex_string: Hex color string (e.g., "#FF0000", "FF0000", "#F00")
+        
+    Returns:
+        The color as ``0xRRGGBB``
+        
+    Raises:
+        ValueError: If the string is not a valid hex color
+    """
+    digits = validate_hex_color(hex_string)
+    if not _HEX_DIGITS.fullmatch(digits):
+        raise ValueError(f"Invalid hex color: {hex_string}")
+    return int(digits, 16)
+
+
 class Color(DrawModel):
     """A color that can be represented in RGB, RGBA, HSL, or hex format.
     
@@ -66,16 +98,18 @@ class Color(DrawModel):
             
         Returns:
             Color instance
+            
+        Raises:
+            ValueError: If the string is not a valid hex color
         """
-        # Validate and normalize hex string
-        hex_normalized = validate_hex_color(hex_string)
-        
-        # Parse RGB values
-        r = int(hex_normalized[0:2], 16)
-        g = int(hex_normalized[2:4], 16)
-        b = int(hex_normalized[4:6], 16)
+        # Parsing is memoized per string; other inputs take the same strict
+        # parse uncached and fail validation there
+        if isinstance(hex_string, str):
+            key = _hex_to_int(hex_string)
+        else:
+            key = _hex_to_int.__wrapped__(hex_string)
         
-        return cls(r=r, g=g, b=b)
+        return cls(r=key >> 16, g=(key >> 8) & 0xFF, b=key & 0xFF, a=1.0)
     
     @classmethod
     def from_hsl(cls, h: float, s: float, l: float, a: float = 1.0) -> "Color":
@@ -188,7 +222,14 @@ class Color(DrawModel):
         if include_alpha:
             alpha_hex = format(int(self.a * 255), '02X')
             return f"#{self.r:02X}{self.g:02X}{self.b:02X}{alpha_hex}"
-        return f"#{self.r:02X}{self.g:02X}{self.b:02X}"
+        
+        key = (self.r << 16) | (self.g << 8) | self.b
+        hex_string = _HEX_STRINGS.get(key)
+        if hex_string is None:
+            hex_string = "#%06X" % key
+            if len(_HEX_STRINGS) < _HEX_STRINGS_LIMIT:
+                _HEX_STRINGS[key] = hex_string
+        return hex_string
     
     def to_rgb(self) -> tuple[int, int, int]:
         """Get RGB values as tuple.
@@ -40,6 +40,8 @@ class Point2D(DrawModel):
     def origin(cls) -> "Point2D":
         """Create a point at the origin (0, 0).
         
+        Points are mutable, so every call returns a fresh instance.
+        
         Returns:
             Point at origin
         """
@@ -259,6 +259,18 @@ class Transform2D(DrawModel):
                 abs(self.ty) < epsilon and
                 (abs(self.a - 1.0) > epsilon or abs(self.d - 1.0) > epsilon))
     
+    def is_axis_aligned(self) -> bool:
+        """Check if this transformation keeps axis-aligned boxes axis-aligned.
+        
+        True for any combination of scaling (including mirroring) and
+        translation, i.e. when there is no rotation or skew.
+        
+        Returns:
+            True if the off-diagonal coefficients b and c are zero
+        """
+        epsilon = 1e-10
+        return abs(self.b) < epsilon and abs(self.c) < epsilon
+    
     def is_rotation(self) -> bool:
         """Check if this is a pure rotation transformation.
         
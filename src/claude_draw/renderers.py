@@ -1,15 +1,74 @@
 """Concrete renderer implementations for Claude Draw."""
 
 import math
-from typing import Any, TYPE_CHECKING
+from functools import lru_cache
+from itertools import groupby, islice
+from operator import eq, itemgetter
+from typing import Any, Callable, Iterable, Optional, Sequence, TYPE_CHECKING
 from claude_draw.visitors import BaseRenderer
 from claude_draw.models.point import Point2D
+from claude_draw.shapes import Circle, Rectangle, Line, Ellipse
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
 
 if TYPE_CHECKING:
-    from claude_draw.shapes import Circle, Rectangle, Line, Ellipse
     from claude_draw.containers import Group, Layer, Drawing
 
 
+@lru_cache(maxsize=None)
+def _number_formatter(precision: int) -> Callable[[float], str]:
+    """Return a memoized fixed-point formatter for the given precision.
+    
+    Drawings repeat coordinates heavily (grids, aligned shapes), so each
+    formatter keeps its own cache of recently formatted values.
+    
+    Args:
+        precision: Number of digits after the decimal point
+        
+    Returns:
+        Callable[[float], str]: Formatter shared by every renderer using
+            this precision
+    """
+    @lru_cache(maxsize=4096)
+    def format_number(value: float) -> str:
+        # 0.0 and -0.0 share a cache entry, so format both as 0.0
+        return f"{value + 0.0:.{precision}f}"
+    
+    return format_number
+
+
+# Formatter for values always written with three decimals, such as opacity
+_f3 = _number_formatter(3)
+
+
+@lru_cache(maxsize=1024, typed=True)
+def _paint_attributes(fill: Optional[str], stroke: Optional[str], stroke_width: float) -> str:
+    """Format the fill and stroke attributes of an SVG element.
+    
+    Scenes draw from a small palette, so the same fragments repeat for most
+    elements and are built once.
+    
+    Args:
+        fill: Fill color as a hex string, or None for no fill
+        stroke: Stroke color as a hex string, or None for no stroke
+        stroke_width: Stroke width, written only when there is a stroke
+        
+    Returns:
+        str: Fill and stroke attributes, each preceded by a space
+    """
+    fill_attr = f' fill="{fill}"' if fill is not None else ' fill="none"'
+    if stroke is None:
+        return f'{fill_attr} stroke="none"'
+    return f'{fill_attr} stroke="{stroke}" stroke-width="{stroke_width}"'
+
+
+# Built-in primitives, rendered and measured without visiting children
+_SHAPE_TYPES = (Circle, Rectangle, Ellipse, Line)
+
+
 class SVGRenderer(BaseRenderer):
     """SVG renderer that demonstrates the visitor pattern.
     
@@ -17,54 +76,88 @@ class SVGRenderer(BaseRenderer):
     and converting them to their SVG equivalents.
     """
     
-    def __init__(self, width: float = 800, height: float = 600):
+    def __init__(
+        self,
+        width: float = 800,
+        height: float = 600,
+        precision: int = 3,
+        minify: bool = False,
+    ):
         """Initialize the SVG renderer.
         
         Args:
             width: Canvas width in pixels
             height: Canvas height in pixels
+            precision: Digits after the decimal point in shape coordinates
+            minify: Write the document without line breaks between tags
+            
+        Raises:
+            ValueError: If precision is negative
         """
+        if precision < 0:
+            raise ValueError("precision must be non-negative")
         super().__init__()
         self.width = width
         self.height = height
+        self.precision = precision
+        self._fmt = _number_formatter(precision)
+        self.minify = minify
+        # Separator written after each tag
+        self._nl = "" if minify else "\n"
         self._defs_content = []
+        # Paint attributes written on the enclosing <g> of a run of shapes
+        self._hoisted_paint: Optional[str] = None
+        # Paint attributes of the shape being visited, when already known
+        self._known_paint: Optional[str] = None
         self._gradient_counter = 0
     
     def begin_render(self) -> None:
         """Initialize the SVG document."""
-        self.emit(f'<?xml version="1.0" encoding="UTF-8"?>\n')
-        self.emit(f'<svg width="{self.width}" height="{self.height}" ')
-        self.emit(f'xmlns="http://www.w3.org/2000/svg" ')
-        self.emit(f'viewBox="0 0 {self.width} {self.height}">\n')
+        self.emit(self._document_header())
+    
+    def _document_header(self) -> str:
+        """Format the start of the SVG document for the current canvas size.
         
-        # Add definitions section for gradients and patterns
-        self.emit('<defs>\n')
+        Returns:
+            str: XML declaration, root element and the opening of the
+                definitions section (gradients and patterns)
+        """
+        nl = self._nl
+        return (
+            f'<?xml version="1.0" encoding="UTF-8"?>{nl}'
+            f'<svg width="{self.width}" height="{self.height}" '
+            f'xmlns="http://www.w3.org/2000/svg" '
+            f'viewBox="0 0 {self.width} {self.height}">{nl}'
+            f'<defs>{nl}'
+        )
     
     def end_render(self) -> None:
         """Finalize the SVG document."""
-        # Close defs section
-        for def_content in self._defs_content:
-            self.emit(def_content)
-        self.emit('</defs>\n')
-        
-        # Close SVG tag
-        self.emit('</svg>\n')
+        # Close defs section and SVG tag
+        nl = self._nl
+        self.emit("".join(self._defs_content) + f'</defs>{nl}</svg>{nl}')
     
     def pre_visit(self, drawable) -> None:
-        """Push drawable's transform to context before visiting."""
-        if hasattr(drawable, 'transform') and not drawable.transform.is_identity():
+        """Push drawable's transform to context before visiting.
+        
+        Identity transforms are pushed too; the context repeats the current
+        matrix for them, which is cheaper than testing here and again in
+        post_visit.
+        """
+        if hasattr(drawable, 'transform'):
             self.context.push_transform(drawable.transform)
     
     def post_visit(self, drawable) -> None:
         """Pop drawable's transform from context after visiting."""
-        if hasattr(drawable, 'transform') and not drawable.transform.is_identity():
+        if hasattr(drawable, 'transform'):
             self.context.pop_transform()
     
     def _format_transform(self) -> str:
         """Format the current transformation matrix as SVG transform attribute.
         
         Returns:
-            str: SVG transform attribute or empty string if identity
+            str: SVG transform attribute preceded by a space, or an empty
+                string if identity
         """
         transform = self.context.current_transform
         
@@ -72,8 +165,14 @@ class SVGRenderer(BaseRenderer):
         if transform.is_identity():
             return ""
         
-        # Format as SVG matrix transform
-        return f'transform="matrix({transform.a},{transform.b},{transform.c},{transform.d},{transform.tx},{transform.ty})"'
+        # Format as SVG matrix transform. Coefficients keep full precision:
+        # rounding them to the coordinate precision distorts rotations and
+        # scales by far more than the rounding of any single coordinate.
+        return (
+            f' transform="matrix({transform.a!r},{transform.b!r},'
+            f'{transform.c!r},{transform.d!r},'
+            f'{transform.tx!r},{transform.ty!r})"'
+        )
     
     def _format_style_attributes(self, drawable) -> str:
         """Format style attributes for an SVG element.
@@ -82,44 +181,117 @@ class SVGRenderer(BaseRenderer):
             drawable: The drawable object with style properties
             
         Returns:
-            str: SVG style attributes
+            str: SVG style attributes, each preceded by a space
+        """
+        attrs = self._known_paint or self._paint_for(drawable)
+        if attrs == self._hoisted_paint:
+            # Inherited from the enclosing <g> written by _visit_children
+            attrs = ''
+        
+        # Opacity
+        effective_opacity = self.context.get_effective_opacity()
+        if hasattr(drawable, 'opacity'):
+            effective_opacity *= drawable.opacity
+        
+        if effective_opacity < 1.0:
+            attrs = f'{attrs} opacity="{_f3(effective_opacity)}"'
+        
+        return attrs
+    
+    def _paint_for(self, drawable) -> str:
+        """Format the fill and stroke attributes a drawable renders with.
+        
+        Args:
+            drawable: The drawable object with style properties
+            
+        Returns:
+            str: SVG fill and stroke attributes, falling back to the
+                current render state for unset colors
         """
-        attrs = []
         state = self.context.current_state
         
         # Fill color
-        if hasattr(drawable, 'fill') and drawable.fill is not None:
-            fill_color = drawable.fill.to_hex()
-            attrs.append(f'fill="{fill_color}"')
-        elif state.fill is not None:
-            fill_color = state.fill.to_hex()
-            attrs.append(f'fill="{fill_color}"')
-        else:
-            attrs.append('fill="none"')
+        fill = getattr(drawable, 'fill', None)
+        if fill is None:
+            fill = state.fill
         
         # Stroke properties
-        if hasattr(drawable, 'stroke') and drawable.stroke is not None:
-            stroke_color = drawable.stroke.to_hex()
-            attrs.append(f'stroke="{stroke_color}"')
-            
+        stroke = getattr(drawable, 'stroke', None)
+        if stroke is not None:
             stroke_width = getattr(drawable, 'stroke_width', 1.0)
-            attrs.append(f'stroke-width="{stroke_width}"')
-        elif state.stroke is not None:
-            stroke_color = state.stroke.to_hex()
-            attrs.append(f'stroke="{stroke_color}"')
-            attrs.append(f'stroke-width="{state.stroke_width}"')
         else:
-            attrs.append('stroke="none"')
+            stroke = state.stroke
+            stroke_width = state.stroke_width
         
-        # Opacity
-        effective_opacity = self.context.get_effective_opacity()
-        if hasattr(drawable, 'opacity'):
-            effective_opacity *= drawable.opacity
+        return _paint_attributes(
+            fill.to_hex() if fill is not None else None,
+            stroke.to_hex() if stroke is not None else None,
+            stroke_width,
+        )
+    
+    def _visit_children(self, children: Iterable[Any]) -> None:
+        """Visit siblings, hoisting paint shared by consecutive shapes.
         
-        if effective_opacity < 1.0:
-            attrs.append(f'opacity="{effective_opacity:.3f}"')
+        Runs of two or more plain shapes with identical fill and stroke are
+        wrapped in a ``<g>`` carrying those attributes once; the shapes
+        inherit them instead of repeating them.
         
-        return " ".join(attrs)
+        Args:
+            children: The drawable objects to visit
+        """
+        children = list(children)
+        # Only plain shapes can share paint; containers break runs
+        paint_for = self._paint_for
+        paints = [
+            paint_for(child) if type(child) in _SHAPE_TYPES else None
+            for child in children
+        ]
+        
+        # Without a single pair of equal neighbours there is nothing to
+        # hoist, so skip the grouping pass and visit everything at once
+        if not any(map(eq, paints, islice(paints, 1, None))):
+            self._visit_painted(zip(children, paints))
+            return
+        
+        pending = []
+        for paint, run in groupby(zip(children, paints), key=itemgetter(1)):
+            run = list(run)
+            if paint is None or len(run) < 2:
+                pending.extend(run)
+                continue
+            
+            if pending:
+                self._visit_painted(pending)
+                pending = []
+            self.emit(f'<g{paint}>{self._nl}')
+            self._hoisted_paint = paint
+            try:
+                self._visit_painted(run)
+            finally:
+                self._hoisted_paint = None
+            self.emit(f'</g>{self._nl}')
+        
+        if pending:
+            self._visit_painted(pending)
+    
+    def _visit_painted(self, run: Iterable[tuple]) -> None:
+        """Visit drawables whose paint attributes were already formatted.
+        
+        Args:
+            run: Pairs of drawable and its paint attributes (None for
+                drawables that are not plain shapes)
+        """
+        dispatch = self._dispatch.get
+        try:
+            for child, paint in run:
+                self._known_paint = paint
+                visit = dispatch(type(child))
+                if visit is None:
+                    child.accept(self)
+                else:
+                    visit(child)
+        finally:
+            self._known_paint = None
     
     def visit_circle(self, circle: "Circle") -> Any:
         """Render a circle as SVG <circle> element."""
@@ -132,11 +304,12 @@ class SVGRenderer(BaseRenderer):
         transform_attr = self._format_transform()
         style_attrs = self._format_style_attributes(circle)
         
-        self.emit(f'<circle cx="{circle.center.x:.3f}" cy="{circle.center.y:.3f}" ')
-        self.emit(f'r="{circle.radius:.3f}" ')
-        if transform_attr:
-            self.emit(f'{transform_attr} ')
-        self.emit(f'{style_attrs}/>\n')
+        fmt = self._fmt
+        center = circle.center
+        self.emit(
+            f'<circle cx="{fmt(center.x)}" cy="{fmt(center.y)}" '
+            f'r="{fmt(circle.radius)}"{transform_attr}{style_attrs}/>{self._nl}'
+        )
         
         self.post_visit(circle)
     
@@ -145,16 +318,18 @@ class SVGRenderer(BaseRenderer):
         self.pre_visit(rectangle)
         
         if not self.context.is_visible():
+            self.post_visit(rectangle)
             return
         
         transform_attr = self._format_transform()
         style_attrs = self._format_style_attributes(rectangle)
         
-        self.emit(f'<rect x="{rectangle.x:.3f}" y="{rectangle.y:.3f}" ')
-        self.emit(f'width="{rectangle.width:.3f}" height="{rectangle.height:.3f}" ')
-        if transform_attr:
-            self.emit(f'{transform_attr} ')
-        self.emit(f'{style_attrs}/>\n')
+        fmt = self._fmt
+        self.emit(
+            f'<rect x="{fmt(rectangle.x)}" y="{fmt(rectangle.y)}" '
+            f'width="{fmt(rectangle.width)}" height="{fmt(rectangle.height)}"'
+            f'{transform_attr}{style_attrs}/>{self._nl}'
+        )
         
         self.post_visit(rectangle)
     
@@ -163,6 +338,7 @@ class SVGRenderer(BaseRenderer):
         self.pre_visit(ellipse)
         
         if not self.context.is_visible():
+            self.post_visit(ellipse)
             return
         
         # Apply transformation to center point
@@ -171,11 +347,12 @@ class SVGRenderer(BaseRenderer):
         transform_attr = self._format_transform()
         style_attrs = self._format_style_attributes(ellipse)
         
-        self.emit(f'<ellipse cx="{center.x:.3f}" cy="{center.y:.3f}" ')
-        self.emit(f'rx="{ellipse.rx:.3f}" ry="{ellipse.ry:.3f}" ')
-        if transform_attr:
-            self.emit(f'{transform_attr} ')
-        self.emit(f'{style_attrs}/>\n')
+        fmt = self._fmt
+        self.emit(
+            f'<ellipse cx="{fmt(center.x)}" cy="{fmt(center.y)}" '
+            f'rx="{fmt(ellipse.rx)}" ry="{fmt(ellipse.ry)}"'
+            f'{transform_attr}{style_attrs}/>{self._nl}'
+        )
         
         self.post_visit(ellipse)
     
@@ -184,6 +361,7 @@ class SVGRenderer(BaseRenderer):
         self.pre_visit(line)
         
         if not self.context.is_visible():
+            self.post_visit(line)
             return
         
         # Apply transformation to endpoints
@@ -193,11 +371,12 @@ class SVGRenderer(BaseRenderer):
         transform_attr = self._format_transform()
         style_attrs = self._format_style_attributes(line)
         
-        self.emit(f'<line x1="{start.x:.3f}" y1="{start.y:.3f}" ')
-        self.emit(f'x2="{end.x:.3f}" y2="{end.y:.3f}" ')
-        if transform_attr:
-            self.emit(f'{transform_attr} ')
-        self.emit(f'{style_attrs}/>\n')
+        fmt = self._fmt
+        self.emit(
+            f'<line x1="{fmt(start.x)}" y1="{fmt(start.y)}" '
+            f'x2="{fmt(end.x)}" y2="{fmt(end.y)}"'
+            f'{transform_attr}{style_attrs}/>{self._nl}'
+        )
         
         self.post_visit(line)
     
@@ -206,26 +385,22 @@ class SVGRenderer(BaseRenderer):
         self.pre_visit(group)
         
         if not self.context.is_visible():
+            self.post_visit(group)
             return
         
         # Start group element
         transform_attr = self._format_transform()
         
-        self.emit('<g ')
-        if transform_attr:
-            self.emit(f'{transform_attr} ')
-        
         # Add group name as id if available
-        if group.name:
-            self.emit(f'id="{group.name}" ')
+        id_attr = f' id="{group.name}"' if group.name else ''
         
-        self.emit('>\n')
+        self.emit(f'<g{transform_attr}{id_attr}>{self._nl}')
         
         # Use the parent class implementation for children traversal
         super().visit_group(group)
         
         # Close group element
-        self.emit('</g>\n')
+        self.emit(f'</g>{self._nl}')
         
         self.post_visit(group)
     
@@ -234,34 +409,34 @@ class SVGRenderer(BaseRenderer):
         self.pre_visit(layer)
         
         if not layer.visible or not self.context.is_visible():
+            self.post_visit(layer)
             return
         
         # Start layer group element
         transform_attr = self._format_transform()
         
-        self.emit('<g ')
-        if transform_attr:
-            self.emit(f'{transform_attr} ')
+        attrs = [f'<g{transform_attr}']
         
         # Add layer name as id if available
         if layer.name:
-            self.emit(f'id="layer_{layer.name}" ')
+            attrs.append(f' id="layer_{layer.name}"')
         
         # Add opacity if less than 1.0
         if layer.opacity < 1.0:
-            self.emit(f'opacity="{layer.opacity:.3f}" ')
+            attrs.append(f' opacity="{_f3(layer.opacity)}"')
         
         # Add blend mode if not normal
         if layer.blend_mode.value != "normal":
-            self.emit(f'style="mix-blend-mode:{layer.blend_mode.value}" ')
+            attrs.append(f' style="mix-blend-mode:{layer.blend_mode.value}"')
         
-        self.emit('>\n')
+        attrs.append(f'>{self._nl}')
+        self.emit("".join(attrs))
         
         # Use the parent class implementation for children traversal
         super().visit_layer(layer)
         
         # Close layer group element
-        self.emit('</g>\n')
+        self.emit(f'</g>{self._nl}')
         
         self.post_visit(layer)
     
@@ -273,14 +448,16 @@ class SVGRenderer(BaseRenderer):
         self.width = drawing.width
         self.height = drawing.height
         
-        # Clear previous output and restart with correct dimensions
-        self._output.clear()
-        self.begin_render()
-        
-        # Add background if specified
+        # Replace previous output with a header of the correct dimensions,
+        # followed by the background if specified, as one fragment
+        header = self._document_header()
         if drawing.background_color:
-            self.emit(f'<rect x="0" y="0" width="{self.width}" ')
-            self.emit(f'height="{self.height}" fill="{drawing.background_color}"/>\n')
+            header += (
+                f'<rect x="0" y="0" width="{self.width}" '
+                f'height="{self.height}" fill="{drawing.background_color}"/>{self._nl}'
+            )
+        self._output.clear()
+        self.emit(header)
         
         # Use the parent class implementation for children traversal
         super().visit_drawing(drawing)
@@ -288,6 +465,11 @@ class SVGRenderer(BaseRenderer):
         self.post_visit(drawing)
 
 
+# Groups with at least this many children, all plain shapes, have their
+# bounds reduced with NumPy when it is installed
+_VECTORIZE_MIN_CHILDREN = 32
+
+
 class BoundingBoxCalculator(BaseRenderer):
     """Example visitor that calculates bounding boxes instead of rendering.
     
@@ -298,13 +480,23 @@ class BoundingBoxCalculator(BaseRenderer):
     def __init__(self):
         """Initialize the bounding box calculator."""
         super().__init__()
-        self.min_x = float('inf')
-        self.min_y = float('inf')
-        self.max_x = float('-inf')
-        self.max_y = float('-inf')
+        self._clear_extents()
     
     def begin_render(self) -> None:
         """Reset bounding box calculation."""
+        self._clear_extents()
+    
+    def reset(self) -> None:
+        """Return the calculator to its initial state for reuse.
+        
+        Clears the accumulated bounds and unwinds the render context to its
+        base entries, keeping the context's composed-transform cache.
+        """
+        self._clear_extents()
+        self.context.reset()
+    
+    def _clear_extents(self) -> None:
+        """Forget all accumulated bounds."""
         self.min_x = float('inf')
         self.min_y = float('inf')
         self.max_x = float('-inf')
@@ -342,9 +534,133 @@ class BoundingBoxCalculator(BaseRenderer):
         self.max_x = max(self.max_x, x)
         self.max_y = max(self.max_y, y)
     
+    def _update_extents(self, extents: tuple) -> None:
+        """Update the overall bounding box with a shape's cached extents.
+        
+        Args:
+            extents: (min_x, min_y, max_x, max_y) of the shape
+        """
+        min_x, min_y, max_x, max_y = extents
+        if min_x < self.min_x:
+            self.min_x = min_x
+        if min_y < self.min_y:
+            self.min_y = min_y
+        if max_x > self.max_x:
+            self.max_x = max_x
+        if max_y > self.max_y:
+            self.max_y = max_y
+    
+    def _update_axis_aligned(self, extents: tuple, transform) -> None:
+        """Update the bounding box with extents under a scale+translate map.
+        
+        Without rotation or skew, the transformed corners' extremes come
+        straight from mapping the two x edges and the two y edges, so no
+        points need to be transformed.
+        
+        Args:
+            extents: (min_x, min_y, max_x, max_y) before the transform
+            transform: Transformation with no rotation or skew
+        """
+        min_x, min_y, max_x, max_y = extents
+        a, d, tx, ty = transform.a, transform.d, transform.tx, transform.ty
+        x0, x1 = a * min_x + tx, a * max_x + tx
+        y0, y1 = d * min_y + ty, d * max_y + ty
+        if x0 > x1:
+            x0, x1 = x1, x0
+        if y0 > y1:
+            y0, y1 = y1, y0
+        self._update_extents((x0, y0, x1, y1))
+    
+    def visit_group(self, group: "Group") -> Any:
+        """Calculate bounds for a group, vectorized for large flat groups.
+        
+        Groups holding many plain shapes under a transform without rotation
+        or skew are reduced with NumPy in one pass; anything else is visited
+        child by child. Both give the same bounds.
+        """
+        children = group.children
+        if (np is None or len(children) < _VECTORIZE_MIN_CHILDREN
+                or not all(type(child) in _SHAPE_TYPES for child in children)):
+            return super().visit_group(group)
+        
+        self.context.push(
+            transform=group.transform,
+            opacity=getattr(group, 'opacity', 1.0),
+            visible=getattr(group, 'visible', True)
+        )
+        try:
+            if self.context.is_visible():
+                transform = self.context.current_transform
+                if transform.is_axis_aligned():
+                    self._update_vectorized(children, transform)
+                else:
+                    self._visit_children(children)
+        finally:
+            self.context.pop()
+        return None
+    
+    def _update_vectorized(self, shapes: Sequence[Any], transform) -> None:
+        """Update the bounding box with many shapes in array operations.
+        
+        Mirrors the per-shape rules: circles and ellipses map their center
+        and keep their radii, rectangles and lines map their edges.
+        
+        Args:
+            shapes: Circles, rectangles, ellipses and lines
+            transform: Transformation with no rotation or skew
+        """
+        centered = []  # (cx, cy, half_width, half_height)
+        edges = []  # (min_x, min_y, max_x, max_y)
+        for shape in shapes:
+            kind = type(shape)
+            if kind is Circle:
+                r = shape.radius
+                centered.append((shape.center.x, shape.center.y, r, r))
+            elif kind is Ellipse:
+                centered.append((shape.center.x, shape.center.y, shape.rx, shape.ry))
+            else:
+                edges.append(shape.extents)
+        
+        a, d, tx, ty = transform.a, transform.d, transform.tx, transform.ty
+        if centered:
+            arr = np.array(centered, dtype=np.float64)
+            cx = a * arr[:, 0] + tx
+            cy = d * arr[:, 1] + ty
+            self._update_extents((
+                float((cx - arr[:, 2]).min()),
+                float((cy - arr[:, 3]).min()),
+                float((cx + arr[:, 2]).max()),
+                float((cy + arr[:, 3]).max()),
+            ))
+        if edges:
+            arr = np.array(edges, dtype=np.float64)
+            x0 = a * arr[:, 0] + tx
+            x1 = a * arr[:, 2] + tx
+            y0 = d * arr[:, 1] + ty
+            y1 = d * arr[:, 3] + ty
+            self._update_extents((
+                float(np.minimum(x0, x1).min()),
+                float(np.minimum(y0, y1).min()),
+                float(np.maximum(x0, x1).max()),
+                float(np.maximum(y0, y1).max()),
+            ))
+    
     def visit_circle(self, circle: "Circle") -> Any:
         """Calculate bounds for a circle."""
-        center = self.context.current_transform.transform_point(circle.center)
+        transform = self.context.current_transform
+        if transform.is_identity():
+            self._update_extents(circle.extents)
+            return
+        
+        if transform.is_axis_aligned():
+            # Only the center moves; the radius is used as-is
+            cx = transform.a * circle.center.x + transform.tx
+            cy = transform.d * circle.center.y + transform.ty
+            r = circle.radius
+            self._update_extents((cx - r, cy - r, cx + r, cy + r))
+            return
+        
+        center = transform.transform_point(circle.center)
         
         # For simplicity, assume uniform scaling
         self._update_bounds(center.x - circle.radius, center.y - circle.radius)
@@ -352,6 +668,14 @@ class BoundingBoxCalculator(BaseRenderer):
     
     def visit_rectangle(self, rectangle: "Rectangle") -> Any:
         """Calculate bounds for a rectangle."""
+        transform = self.context.current_transform
+        if transform.is_identity():
+            self._update_extents(rectangle.extents)
+            return
+        if transform.is_axis_aligned():
+            self._update_axis_aligned(rectangle.extents, transform)
+            return
+        
         # Transform all four corners
         corners = [
             Point2D(x=rectangle.x, y=rectangle.y),
@@ -361,12 +685,25 @@ class BoundingBoxCalculator(BaseRenderer):
         ]
         
         for corner in corners:
-            transformed = self.context.current_transform.transform_point(corner)
+            transformed = transform.transform_point(corner)
             self._update_bounds(transformed.x, transformed.y)
     
     def visit_ellipse(self, ellipse: "Ellipse") -> Any:
         """Calculate bounds for an ellipse."""
-        center = self.context.current_transform.transform_point(ellipse.center)
+        transform = self.context.current_transform
+        if transform.is_identity():
+            self._update_extents(ellipse.extents)
+            return
+        
+        if transform.is_axis_aligned():
+            # Only the center moves; the radii are used as-is
+            cx = transform.a * ellipse.center.x + transform.tx
+            cy = transform.d * ellipse.center.y + transform.ty
+            rx, ry = ellipse.rx, ellipse.ry
+            self._update_extents((cx - rx, cy - ry, cx + rx, cy + ry))
+            return
+        
+        center = transform.transform_point(ellipse.center)
         
         # For simplicity, use axis-aligned bounding box
         self._update_bounds(center.x - ellipse.rx, center.y - ellipse.ry)
@@ -374,8 +711,16 @@ class BoundingBoxCalculator(BaseRenderer):
     
     def visit_line(self, line: "Line") -> Any:
         """Calculate bounds for a line."""
-        start = self.context.current_transform.transform_point(line.start)
-        end = self.context.current_transform.transform_point(line.end)
+        transform = self.context.current_transform
+        if transform.is_identity():
+            self._update_extents(line.extents)
+            return
+        if transform.is_axis_aligned():
+            self._update_axis_aligned(line.extents, transform)
+            return
+        
+        start = transform.transform_point(line.start)
+        end = transform.transform_point(line.end)
         
         self._update_bounds(start.x, start.y)
         self._update_bounds(end.x, end.y)
\ No newline at end of file
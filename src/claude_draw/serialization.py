@@ -1,16 +1,75 @@
 """Enhanced serialization support for Claude Draw objects."""
 
+import io
 import json
+import mmap
+import os
+import struct
+import sys
+import types
+from contextlib import contextmanager
 from enum import Enum
-from typing import Dict, Any, Type, Union, List, Optional, TYPE_CHECKING
+from json.encoder import encode_basestring, encode_basestring_ascii
+from typing import (
+    Dict, Any, BinaryIO, Callable, Iterable, Iterator, TextIO, Tuple, Type, Union, List,
+    Optional, TYPE_CHECKING,
+)
 from pydantic import BaseModel
 from claude_draw.models.base import DrawModel
+from claude_draw.models.color import Color
+from claude_draw.models.point import Point2D
+from claude_draw.models.transform import Transform2D
 
 if TYPE_CHECKING:
     from claude_draw.base import Drawable
     from claude_draw.shapes import Circle, Rectangle, Line, Ellipse
     from claude_draw.containers import Group, Layer, Drawing
 
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+
+# File suffixes stored as MessagePack; a path without a suffix is binary too.
+_MSGPACK_SUFFIXES = (".mpk", ".msgpack", "")
+
+# Metadata keys are interned once so every emitted dict shares the same key
+# objects and lookups against them hit the identity fast path.
+_TYPE_KEY = sys.intern("__type__")
+_VERSION_KEY = sys.intern("__version__")
+_ID_KEY = sys.intern("__id__")
+_REF_KEY = sys.intern("__ref__")
+_BATCH_KEY = sys.intern("__batch__")
+_SCHEMA_VERSION = sys.intern("1.0")
+
+# Wire type of a packed (N, 2) float64 point array.
+_POINT_ARRAY_TYPE = sys.intern("Point2DArray")
+
+# Raw byte inputs accepted by the deserializers; decoded as UTF-8 JSON.
+_BUFFER_TYPES = (bytes, bytearray, memoryview, mmap.mmap)
+
+# MessagePack extension carrying a Transform2D as six little-endian doubles
+# (a, b, c, d, tx, ty) in one fixed 48-byte payload.
+_TRANSFORM_EXT = 1
+_TRANSFORM_STRUCT = struct.Struct('<6d')
+
+# MessagePack extension carrying an (N, 2) point array as its interleaved
+# x, y coordinates in little-endian doubles.
+_POINT_ARRAY_EXT = 2
+
+# Shortest same-type run of children written in columnar batch form.
+_BATCH_MIN_RUN = 4
+
+# Quoted key markers used to reject untyped JSON text before parsing it.
+_TYPE_MARKER = '"__type__"'
+_REF_MARKER = '"__ref__"'
+
 
 class SerializationRegistry:
     """Registry for mapping type discriminators to classes.
@@ -31,6 +90,7 @@ class SerializationRegistry:
             type_name: String identifier for the type
             cls: The class to register
         """
+        type_name = sys.intern(type_name)
         self._class_registry[type_name] = cls
         self._reverse_registry[cls] = type_name
     
@@ -103,6 +163,18 @@ def get_type_discriminator(obj: DrawModel) -> Optional[str]:
     return _registry.get_type_name(type(obj))
 
 
+# Hand-written dict builders for the fixed-shape leaf models that make up most
+# nested values (centers, colors, transforms). Dispatch is keyed on the exact
+# type so subclasses still go through the generic reflective path.
+_LEAF_SERIALIZERS = {
+    Point2D: lambda p: {"x": p.x, "y": p.y},
+    Color: lambda c: {"r": c.r, "g": c.g, "b": c.b, "a": c.a},
+    Transform2D: lambda t: {
+        "a": t.a, "b": t.b, "c": t.c, "d": t.d, "tx": t.tx, "ty": t.ty
+    },
+}
+
+
 class EnhancedJSONEncoder(json.JSONEncoder):
     """Enhanced JSON encoder for Claude Draw objects.
     
@@ -110,18 +182,40 @@ class EnhancedJSONEncoder(json.JSONEncoder):
     for drawable objects and their relationships.
     """
     
-    def __init__(self, include_version: bool = True, **kwargs):
+    # Exact-type serializers for leaf value models; subclasses may extend it
+    _leaf_serializers = _LEAF_SERIALIZERS
+    
+    def __init__(self, include_version: bool = True, batch_children: bool = False, **kwargs):
         """Initialize the enhanced JSON encoder.
         
         Args:
             include_version: Whether to include version information
+            batch_children: Whether to write runs of same-type children
+                as a single columnar ``__batch__`` object
             **kwargs: Additional arguments for JSONEncoder
         """
         super().__init__(**kwargs)
         self.include_version = include_version
+        self.batch_children = batch_children
         self._object_refs: Dict[int, str] = {}
         self._ref_counter = 0
     
+    def encode(self, o):
+        """Encode an object graph, starting from a fresh reference table.
+        
+        Reference ids are keyed by ``id()``, so an encoder reused across
+        documents must forget the previous document's objects.
+        
+        Args:
+            o: Object to encode
+            
+        Returns:
+            JSON string representation
+        """
+        self._object_refs = {}
+        self._ref_counter = 0
+        return super().encode(o)
+    
     def default(self, obj):
         """Convert object to JSON-serializable format.
         
@@ -134,9 +228,28 @@ class EnhancedJSONEncoder(json.JSONEncoder):
         if isinstance(obj, DrawModel):
             return self._serialize_draw_model(obj)
         
+        if (np is not None and isinstance(obj, np.ndarray)
+                and obj.ndim == 2 and obj.shape[1] == 2):
+            return self._encode_point_array(obj)
+        
         # Handle other special types as needed
         return super().default(obj)
     
+    def _encode_point_array(self, points: "np.ndarray") -> Dict[str, Any]:
+        """Serialize an (N, 2) coordinate array as one flat list.
+        
+        Args:
+            points: Array of x, y rows
+            
+        Returns:
+            Dictionary with the ``Point2DArray`` discriminator and an
+            interleaved ``xy`` list
+        """
+        return {
+            _TYPE_KEY: _POINT_ARRAY_TYPE,
+            "xy": np.asarray(points, dtype=np.float64).ravel().tolist(),
+        }
+    
     def _serialize_draw_model(self, obj: DrawModel) -> Dict[str, Any]:
         """Serialize a DrawModel object with type discriminator.
         
@@ -146,6 +259,10 @@ class EnhancedJSONEncoder(json.JSONEncoder):
         Returns:
             Dictionary representation with type information
         """
+        leaf = self._leaf_serializers.get(type(obj))
+        if leaf is not None:
+            return leaf(obj)
+        
         # Import here to avoid circular imports
         from claude_draw.base import Drawable
         
@@ -155,7 +272,7 @@ class EnhancedJSONEncoder(json.JSONEncoder):
             obj_id = id(obj)
             if obj_id in self._object_refs:
                 # Return a reference instead of the full object
-                return {"__ref__": self._object_refs[obj_id]}
+                return {_REF_KEY: self._object_refs[obj_id]}
             
             # Assign a reference ID
             ref_id = f"obj_{self._ref_counter}"
@@ -164,21 +281,28 @@ class EnhancedJSONEncoder(json.JSONEncoder):
         else:
             ref_id = None
         
-        # Build dictionary manually to avoid polymorphic issues
-        data = {}
+        # Build dictionary manually to avoid polymorphic issues. Preallocating
+        # the field keys keeps model field order and avoids rehashing as the
+        # dict grows.
+        fields = obj.__class__.model_fields
+        data = dict.fromkeys(fields)
         
         # Get all fields from the actual class, not the base class
-        for field_name, field_info in obj.__class__.model_fields.items():
+        for field_name in fields:
             value = getattr(obj, field_name)
             
-            if isinstance(value, DrawModel):
+            leaf = self._leaf_serializers.get(type(value))
+            if leaf is not None:
+                data[field_name] = leaf(value)
+            elif isinstance(value, DrawModel):
                 data[field_name] = self._serialize_draw_model(value)
             elif isinstance(value, list):
-                data[field_name] = [
+                items = [
                     self._serialize_draw_model(item) if isinstance(item, DrawModel) else 
                     (item.model_dump() if hasattr(item, 'model_dump') else item)
                     for item in value
                 ]
+                data[field_name] = _batch_runs(items) if self.batch_children else items
             elif isinstance(value, dict):
                 data[field_name] = {
                     k: self._serialize_draw_model(v) if isinstance(v, DrawModel) else 
@@ -199,22 +323,293 @@ class EnhancedJSONEncoder(json.JSONEncoder):
         if isinstance(obj, Drawable):
             type_name = get_type_discriminator(obj)
             if type_name:
-                data["__type__"] = type_name
+                data[_TYPE_KEY] = type_name
             else:
                 # Fallback to class name if not registered
-                data["__type__"] = obj.__class__.__name__
+                data[_TYPE_KEY] = obj.__class__.__name__
             
             # Add version if requested for Drawable objects
             if self.include_version:
-                data["__version__"] = "1.0"
+                data[_VERSION_KEY] = _SCHEMA_VERSION
         
         # Add reference ID only for Drawable objects
         if ref_id:
-            data["__id__"] = ref_id
+            data[_ID_KEY] = ref_id
         
         return data
 
 
+# Keyword arguments StreamingEncoder understands; anything else falls back
+# to json.dumps with EnhancedJSONEncoder.
+_STREAMING_OPTIONS = frozenset({"include_version", "indent", "ensure_ascii"})
+
+
+def _float_repr(value: float) -> str:
+    """Format a float exactly as the json module does."""
+    if value != value:
+        return "NaN"
+    if value == float("inf"):
+        return "Infinity"
+    if value == float("-inf"):
+        return "-Infinity"
+    return float.__repr__(value)
+
+
+class StreamingEncoder:
+    """Encoder that writes enhanced JSON straight to a text stream.
+    
+    The output is identical to ``json.dumps(obj, cls=EnhancedJSONEncoder)``
+    with the same options, but the model tree is walked once and tokens are
+    written as they are produced, so neither the intermediate nested dict
+    nor (when writing to a file) the complete JSON string is ever built.
+    
+    Only ``include_version``, ``indent`` and ``ensure_ascii`` are supported;
+    use EnhancedJSONEncoder for the other json options.
+    """
+    
+    def __init__(
+        self,
+        include_version: bool = True,
+        indent: Optional[Union[int, str]] = None,
+        ensure_ascii: bool = True,
+    ):
+        """Initialize the streaming encoder.
+        
+        Args:
+            include_version: Whether to include version information
+            indent: Pretty-print indentation, as for json.dumps
+            ensure_ascii: Whether to escape non-ASCII characters
+        """
+        self.include_version = include_version
+        self.indent = " " * indent if isinstance(indent, int) else indent
+        self._encode_str = encode_basestring_ascii if ensure_ascii else encode_basestring
+        self._fallback = EnhancedJSONEncoder(include_version=include_version)
+        self._object_refs: Dict[int, str] = {}
+        self._ref_counter = 0
+    
+    def encode(self, obj: Any) -> str:
+        """Encode an object graph to a JSON string.
+        
+        Args:
+            obj: Object to encode
+            
+        Returns:
+            JSON string representation
+        """
+        buffer = io.StringIO()
+        self.encode_to(obj, buffer)
+        return buffer.getvalue()
+    
+    def encode_to(self, obj: Any, out: TextIO) -> None:
+        """Write an object graph as JSON to a text stream.
+        
+        Args:
+            obj: Object to encode
+            out: Writable text stream, such as an open file or StringIO
+        """
+        self._object_refs = {}
+        self._ref_counter = 0
+        self._write_value(obj, out.write, 0)
+    
+    def _model_items(self, obj: DrawModel) -> Iterator[Tuple[str, Any]]:
+        """Yield the key/value pairs EnhancedJSONEncoder would emit for a model."""
+        from claude_draw.base import Drawable
+        
+        if not isinstance(obj, Drawable):
+            for field_name in obj.__class__.model_fields:
+                yield field_name, getattr(obj, field_name)
+            return
+        
+        obj_id = id(obj)
+        ref_id = self._object_refs.get(obj_id)
+        if ref_id is not None:
+            yield _REF_KEY, ref_id
+            return
+        ref_id = f"obj_{self._ref_counter}"
+        self._object_refs[obj_id] = ref_id
+        self._ref_counter += 1
+        
+        for field_name in obj.__class__.model_fields:
+            yield field_name, getattr(obj, field_name)
+        
+        yield _TYPE_KEY, get_type_discriminator(obj) or obj.__class__.__name__
+        if self.include_version:
+            yield _VERSION_KEY, _SCHEMA_VERSION
+        yield _ID_KEY, ref_id
+    
+    def _write_value(self, value: Any, write: Callable[[str], Any], depth: int) -> None:
+        """Write any JSON-encodable value at the given nesting depth."""
+        if value is None:
+            write("null")
+        elif value is True:
+            write("true")
+        elif value is False:
+            write("false")
+        elif isinstance(value, str):
+            write(self._encode_str(value))
+        elif isinstance(value, int):
+            write(int.__repr__(value))
+        elif isinstance(value, float):
+            write(_float_repr(value))
+        elif isinstance(value, DrawModel):
+            self._write_object(self._model_items(value), write, depth)
+        elif isinstance(value, (list, tuple)):
+            self._write_array(value, write, depth)
+        elif isinstance(value, dict):
+            self._write_object(value.items(), write, depth)
+        elif isinstance(value, Enum):
+            self._write_value(value.value, write, depth)
+        elif hasattr(value, 'model_dump'):
+            self._write_object(value.model_dump().items(), write, depth)
+        else:
+            self._write_value(self._fallback.default(value), write, depth)
+    
+    def _write_object(
+        self,
+        items: Iterable[Tuple[str, Any]],
+        write: Callable[[str], Any],
+        depth: int,
+    ) -> None:
+        """Write key/value pairs as a JSON object."""
+        if self.indent is None:
+            opening = ""
+            separator = ", "
+        else:
+            opening = "\n" + self.indent * (depth + 1)
+            separator = "," + opening
+        
+        write("{")
+        first = True
+        for key, value in items:
+            if first:
+                write(opening)
+                first = False
+            else:
+                write(separator)
+            write(self._encode_str(key))
+            write(": ")
+            self._write_value(value, write, depth + 1)
+        if not first and self.indent is not None:
+            write("\n" + self.indent * depth)
+        write("}")
+    
+    def _write_array(self, items: Iterable[Any], write: Callable[[str], Any], depth: int) -> None:
+        """Write a sequence as a JSON array."""
+        if self.indent is None:
+            opening = ""
+            separator = ", "
+        else:
+            opening = "\n" + self.indent * (depth + 1)
+            separator = "," + opening
+        
+        write("[")
+        first = True
+        for item in items:
+            if first:
+                write(opening)
+                first = False
+            else:
+                write(separator)
+            self._write_value(item, write, depth + 1)
+        if not first and self.indent is not None:
+            write("\n" + self.indent * depth)
+        write("]")
+
+
+def _decode_point_array(data: Dict[str, Any]) -> "np.ndarray":
+    """Decode a serialized point array into an (N, 2) float64 array in one call.
+    
+    Args:
+        data: The ``Point2DArray`` wire form with an interleaved ``xy`` list
+            
+    Returns:
+        Array with one x, y row per point
+        
+    Raises:
+        ImportError: If numpy is not installed
+    """
+    _require_numpy()
+    return np.asarray(data["xy"], dtype=np.float64).reshape(-1, 2)
+
+
+def _batch_runs(items: List[Any]) -> List[Any]:
+    """Collapse runs of same-type serialized drawables into batch objects.
+    
+    A run of at least ``_BATCH_MIN_RUN`` dicts sharing one ``__type__`` is
+    replaced by ``{"__batch__": type, key: [values...], ...}`` holding one
+    column per key, so the type tag and key names are written once.
+    
+    Args:
+        items: Serialized list items
+        
+    Returns:
+        The list with qualifying runs replaced by batch objects
+    """
+    result = []
+    i = 0
+    count = len(items)
+    while i < count:
+        item = items[i]
+        type_name = item.get(_TYPE_KEY) if isinstance(item, dict) else None
+        j = i + 1
+        if type_name is not None:
+            while (j < count and isinstance(items[j], dict)
+                   and items[j].get(_TYPE_KEY) == type_name):
+                j += 1
+        
+        if j - i >= _BATCH_MIN_RUN:
+            run = items[i:j]
+            batch = {_BATCH_KEY: type_name}
+            for key in item:
+                if key != _TYPE_KEY:
+                    batch[key] = [entry[key] for entry in run]
+            result.append(batch)
+        else:
+            result.extend(items[i:j])
+        i = j
+    return result
+
+
+def _expand_batches(items: List[Any]) -> List[Any]:
+    """Expand ``__batch__`` objects back into one dict per drawable.
+    
+    Args:
+        items: Serialized list items, possibly containing batch objects
+        
+    Returns:
+        The list with every batch object replaced by its rows
+    """
+    if not any(isinstance(item, dict) and _BATCH_KEY in item for item in items):
+        return items
+    
+    result = []
+    for item in items:
+        if isinstance(item, dict) and _BATCH_KEY in item:
+            type_name = item[_BATCH_KEY]
+            keys = [key for key in item if key != _BATCH_KEY]
+            for row in zip(*(item[key] for key in keys)):
+                entry = dict(zip(keys, row))
+                entry[_TYPE_KEY] = type_name
+                result.append(entry)
+        else:
+            result.append(item)
+    return result
+
+
+def _enhanced_dict(obj: DrawModel, include_version: bool = True) -> Dict[str, Any]:
+    """Serialize a model to a new enhanced dict.
+    
+    Args:
+        obj: Model to serialize
+        include_version: Whether to include version information
+        
+    Returns:
+        Enhanced dictionary representation
+    """
+    encoder = EnhancedJSONEncoder(include_version=include_version)
+    return encoder._serialize_draw_model(obj)
+
+
 class SerializationMixin:
     """Mixin providing enhanced serialization capabilities.
     
@@ -227,17 +622,13 @@ class SerializationMixin:
         
         Args:
             include_version: Whether to include version information
-            **kwargs: Additional arguments for JSON encoder
+            **kwargs: Additional arguments for serialize_drawable(),
+                including encoder options such as batch_children
             
         Returns:
             Enhanced JSON string representation
         """
-        return json.dumps(
-            self,
-            cls=EnhancedJSONEncoder,
-            include_version=include_version,
-            **kwargs
-        )
+        return serialize_drawable(self, include_version=include_version, **kwargs)
     
     def to_dict_enhanced(self, include_version: bool = True) -> Dict[str, Any]:
         """Convert to dictionary with enhanced features.
@@ -248,11 +639,111 @@ class SerializationMixin:
         Returns:
             Enhanced dictionary representation
         """
-        encoder = EnhancedJSONEncoder(include_version=include_version)
-        return encoder._serialize_draw_model(self)
+        return _enhanced_dict(self, include_version)
+
+
+# Per-class map of field name -> converter used by the trusted construction
+# path. Built lazily the first time a class is deserialized.
+_TRUSTED_FIELD_PLANS: Dict[type, Dict[str, Callable[[Any], Any]]] = {}
 
 
-def deserialize_drawable(data: Union[str, Dict[str, Any]]) -> "Drawable":
+def _nested_model_type(annotation: Any) -> Optional[Type[DrawModel]]:
+    """Return the non-drawable DrawModel type behind a field annotation.
+    
+    Args:
+        annotation: Field annotation, possibly wrapped in Optional
+        
+    Returns:
+        The DrawModel subclass stored in the field, or None if the field
+        does not hold a plain value model such as Point2D or Color
+    """
+    from claude_draw.base import Drawable
+    
+    if getattr(annotation, '__origin__', None) is Union or isinstance(annotation, types.UnionType):
+        candidates = [arg for arg in annotation.__args__ if arg is not type(None)]
+        if len(candidates) != 1:
+            return None
+        annotation = candidates[0]
+    
+    if (isinstance(annotation, type) and issubclass(annotation, DrawModel)
+            and not issubclass(annotation, Drawable)):
+        return annotation
+    return None
+
+
+def _trusted_field_plan(cls: Type[DrawModel]) -> Dict[str, Callable[[Any], Any]]:
+    """Build (and cache) the converters needed to construct ``cls`` unvalidated.
+    
+    Only fields holding nested value models need converting; every other
+    field is passed to ``model_construct`` as-is.
+    
+    Args:
+        cls: The model class being constructed
+        
+    Returns:
+        Mapping of field name to converter for the fields that need one
+    """
+    plan = _TRUSTED_FIELD_PLANS.get(cls)
+    if plan is None:
+        plan = {}
+        for field_name, field_info in cls.model_fields.items():
+            nested = _nested_model_type(field_info.annotation)
+            if nested is not None:
+                plan[field_name] = (
+                    lambda value, nested=nested:
+                    _construct_trusted(nested, value) if isinstance(value, dict) else value
+                )
+        _TRUSTED_FIELD_PLANS[cls] = plan
+    return plan
+
+
+def _construct_trusted(cls: Type[DrawModel], values: Dict[str, Any]) -> DrawModel:
+    """Instantiate ``cls`` from already-valid data without running validators.
+    
+    Args:
+        cls: The model class to instantiate
+        values: Field values with nested drawables already deserialized
+        
+    Returns:
+        The constructed model instance
+    """
+    for field_name, convert in _trusted_field_plan(cls).items():
+        if field_name in values:
+            values[field_name] = convert(values[field_name])
+    return cls.model_construct(**values)
+
+
+def _check_type_marker(text: str) -> None:
+    """Reject JSON object text that cannot contain a type discriminator.
+    
+    A substring search is far cheaper than a full parse, so obviously
+    untyped uploads are refused before ``json.loads`` runs. The text has
+    not been parsed at that point, so the error covers malformed text as
+    well. Text that is not a JSON object, or that uses ``\\u`` escapes
+    (which could spell the key differently), is left for the parser to
+    judge.
+    
+    Args:
+        text: Raw JSON text
+        
+    Raises:
+        ValueError: If the text starts like an object but never mentions
+            a type discriminator, whether or not it is valid JSON
+    """
+    if (text.lstrip().startswith("{")
+            and _TYPE_MARKER not in text
+            and _REF_MARKER not in text
+            and "\\u" not in text):
+        raise ValueError(
+            "Data is not a typed drawable "
+            "(missing '__type__' or invalid JSON)"
+        )
+
+
+def deserialize_drawable(
+    data: Union[str, bytes, Dict[str, Any]],
+    trust_input: bool = False,
+) -> "Drawable":
     """Deserialize a drawable object from JSON data with type restoration.
     
     This function reconstructs Claude Draw objects from JSON data that
@@ -267,6 +758,13 @@ def deserialize_drawable(data: Union[str, Dict[str, Any]]) -> "Drawable":
     5. Handle enum conversions
     6. Validate and instantiate object
     
+    By default every object goes through full Pydantic validation. Callers
+    that wrote the data themselves can pass ``trust_input=True`` to build
+    objects stamped with the current schema version through
+    ``model_construct`` instead, skipping the validators. The version stamp
+    is part of the payload, so it says nothing about where the data came
+    from; never enable trust for data received from elsewhere.
+    
     Type safety features:
     - Registry-based type lookup
     - Recursive type preservation
@@ -274,9 +772,13 @@ def deserialize_drawable(data: Union[str, Dict[str, Any]]) -> "Drawable":
     - Pydantic validation
     
     Args:
-        data: JSON string or dictionary containing serialized data.
+        data: JSON string, UTF-8 JSON bytes (bytes, bytearray,
+            memoryview or mmap), or dictionary containing serialized data.
             Must include __type__ field for proper deserialization.
             Can be output from serialize_drawable() or compatible format.
+        trust_input: Whether data carrying the current ``__version__``
+            may skip validation. Only pass True for data this process
+            (or application) serialized itself.
         
     Returns:
         Drawable: Deserialized object with correct type restored.
@@ -284,10 +786,13 @@ def deserialize_drawable(data: Union[str, Dict[str, Any]]) -> "Drawable":
         
     Raises:
         ValueError: If type discriminator is missing or unknown,
-            or if circular references are present
+            or if circular references are present. Object text that never
+            mentions ``__type__`` is rejected this way before parsing,
+            even when it is also invalid JSON
         TypeError: If data format is invalid (not dict or string)
         ValidationError: If data doesn't match the expected schema
-        json.JSONDecodeError: If string input is not valid JSON
+        json.JSONDecodeError: If string input that passes the
+            discriminator scan is not valid JSON (a ValueError subclass)
         
     Example:
         >>> data = {
@@ -298,18 +803,22 @@ def deserialize_drawable(data: Union[str, Dict[str, Any]]) -> "Drawable":
         >>> circle = deserialize_drawable(data)
         >>> assert isinstance(circle, Circle)
     """
+    if isinstance(data, _BUFFER_TYPES):
+        data = str(data, 'utf-8')
+    
     if isinstance(data, str):
+        _check_type_marker(data)
         data = json.loads(data)
     
     if not isinstance(data, dict):
         raise TypeError("Data must be a dictionary or JSON string")
     
     # Handle references
-    if "__ref__" in data:
+    if _REF_KEY in data:
         raise ValueError("Cannot deserialize reference without context. Use deserialize_with_references instead.")
     
     # Extract type discriminator
-    type_name = data.get("__type__")
+    type_name = data.get(_TYPE_KEY)
     if not type_name:
         raise ValueError("Missing type discriminator '__type__' in data")
     
@@ -324,14 +833,22 @@ def deserialize_drawable(data: Union[str, Dict[str, Any]]) -> "Drawable":
     
     # Process nested objects recursively
     for key, value in clean_data.items():
-        if isinstance(value, dict) and "__type__" in value:
-            clean_data[key] = deserialize_drawable(value)
+        if isinstance(value, dict) and _TYPE_KEY in value:
+            if value[_TYPE_KEY] == _POINT_ARRAY_TYPE:
+                clean_data[key] = _decode_point_array(value)
+            else:
+                clean_data[key] = deserialize_drawable(value, trust_input)
         elif isinstance(value, list):
             clean_data[key] = [
-                deserialize_drawable(item) if isinstance(item, dict) and "__type__" in item 
-                else item for item in value
+                deserialize_drawable(item, trust_input) if isinstance(item, dict) and _TYPE_KEY in item 
+                else item for item in _expand_batches(value)
             ]
     
+    # The caller vouches that this is output of our own encoder, which is
+    # valid at the current schema version, so skip re-running validators.
+    if trust_input and data.get(_VERSION_KEY) == _SCHEMA_VERSION:
+        return _construct_trusted(cls, clean_data)
+    
     # Handle enum fields manually for strict validation
     if hasattr(cls, 'model_fields'):
         for field_name, field_info in cls.model_fields.items():
@@ -357,7 +874,7 @@ def deserialize_drawable(data: Union[str, Dict[str, Any]]) -> "Drawable":
     return cls.model_validate(clean_data)
 
 
-def deserialize_with_references(data: Union[str, Dict[str, Any]]) -> "Drawable":
+def deserialize_with_references(data: Union[str, bytes, Dict[str, Any]]) -> "Drawable":
     """Deserialize drawable objects with full circular reference support.
     
     This advanced deserialization function handles complex object graphs
@@ -382,8 +899,8 @@ def deserialize_with_references(data: Union[str, Dict[str, Any]]) -> "Drawable":
     - Enables structure sharing in JSON
     
     Args:
-        data: JSON string or dictionary containing serialized data
-            with potential __ref__ and __id__ fields for reference
+        data: JSON string, UTF-8 JSON bytes, or dictionary containing
+            serialized data with potential __ref__ and __id__ fields for reference
             management.
         
     Returns:
@@ -401,6 +918,9 @@ def deserialize_with_references(data: Union[str, Dict[str, Any]]) -> "Drawable":
         should only be used when circular references are expected.
         For simple hierarchies, use the standard function.
     """
+    if isinstance(data, _BUFFER_TYPES):
+        data = str(data, 'utf-8')
+    
     if isinstance(data, str):
         data = json.loads(data)
     
@@ -415,8 +935,8 @@ def deserialize_with_references(data: Union[str, Dict[str, Any]]) -> "Drawable":
         """Recursively deserialize with reference tracking."""
         
         # Handle reference
-        if "__ref__" in obj_data:
-            ref_id = obj_data["__ref__"]
+        if _REF_KEY in obj_data:
+            ref_id = obj_data[_REF_KEY]
             if ref_id in object_cache:
                 return object_cache[ref_id]
             else:
@@ -425,8 +945,8 @@ def deserialize_with_references(data: Union[str, Dict[str, Any]]) -> "Drawable":
                 return None  # Will be resolved in second pass
         
         # Extract metadata
-        type_name = obj_data.get("__type__")
-        obj_id = obj_data.get("__id__")
+        type_name = obj_data.get(_TYPE_KEY)
+        obj_id = obj_data.get(_ID_KEY)
         
         if not type_name:
             raise ValueError("Missing type discriminator '__type__' in data")
@@ -442,12 +962,15 @@ def deserialize_with_references(data: Union[str, Dict[str, Any]]) -> "Drawable":
         
         # Process nested objects recursively
         for key, value in clean_data.items():
-            if isinstance(value, dict) and "__type__" in value:
-                clean_data[key] = _deserialize_recursive(value)
+            if isinstance(value, dict) and _TYPE_KEY in value:
+                if value[_TYPE_KEY] == _POINT_ARRAY_TYPE:
+                    clean_data[key] = _decode_point_array(value)
+                else:
+                    clean_data[key] = _deserialize_recursive(value)
             elif isinstance(value, list):
                 clean_data[key] = [
-                    _deserialize_recursive(item) if isinstance(item, dict) and "__type__" in item 
-                    else item for item in value
+                    _deserialize_recursive(item) if isinstance(item, dict) and _TYPE_KEY in item 
+                    else item for item in _expand_batches(value)
                 ]
         
         # Create object
@@ -473,7 +996,11 @@ def deserialize_with_references(data: Union[str, Dict[str, Any]]) -> "Drawable":
     return result
 
 
-def serialize_drawable(obj: "Drawable", **kwargs) -> str:
+def serialize_drawable(
+    obj: "Drawable",
+    encoder: Optional[EnhancedJSONEncoder] = None,
+    **kwargs,
+) -> str:
     """Serialize drawable objects to enhanced JSON format.
     
     Primary serialization function that converts Claude Draw objects
@@ -490,40 +1017,165 @@ def serialize_drawable(obj: "Drawable", **kwargs) -> str:
     Args:
         obj: Drawable object to serialize. Any DrawModel subclass
             including shapes, containers, or complete drawings.
+        encoder: Existing encoder to reuse instead of building one per
+            call. Its own settings apply and ``kwargs`` must be empty.
         **kwargs: Additional arguments for JSON encoder:
             - indent: Pretty-print indentation (e.g., indent=2)
             - sort_keys: Sort dictionary keys alphabetically
             - ensure_ascii: Force ASCII-only output
             - include_version: Include __version__ field (default: True)
+            - batch_children: Write runs of four or more same-type
+              children as one columnar __batch__ object (default: False)
         
     Returns:
         str: JSON string with type discriminators and metadata.
             Output is suitable for deserialize_drawable() function.
             
+    Raises:
+        TypeError: If encoder options are passed along with ``encoder``
+            
     Example:
         >>> rect = Rectangle(x=0, y=0, width=100, height=50)
         >>> json_str = serialize_drawable(rect, indent=2)
         >>> # Output includes __type__ for deserialization
     """
+    if encoder is not None:
+        if kwargs:
+            raise TypeError("Encoder options cannot be combined with an explicit encoder")
+        return encoder.encode(obj)
+    # Indented output bypasses json's C accelerator, so writing tokens
+    # directly is faster there; compact output stays on the C encoder.
+    if kwargs.get("indent") is not None and kwargs.keys() <= _STREAMING_OPTIONS:
+        return StreamingEncoder(**kwargs).encode(obj)
     return json.dumps(obj, cls=EnhancedJSONEncoder, **kwargs)
 
 
-def load_drawable(filename: str) -> "Drawable":
-    """Load a drawable object from a JSON file.
+class _MsgpackEncoder(EnhancedJSONEncoder):
+    """Encoder building MessagePack-ready dicts with packed transforms."""
+    
+    _leaf_serializers = {
+        **_LEAF_SERIALIZERS,
+        Transform2D: lambda t: msgpack.ExtType(
+            _TRANSFORM_EXT, _TRANSFORM_STRUCT.pack(t.a, t.b, t.c, t.d, t.tx, t.ty)
+        ),
+    }
+
+
+def _msgpack_default(obj: Any) -> Any:
+    """Pack values msgpack has no native encoding for.
+    
+    Args:
+        obj: Value found while packing a drawing
+        
+    Returns:
+        An ExtType holding the raw coordinates of an (N, 2) point array
+        
+    Raises:
+        TypeError: If the value cannot be stored in a MessagePack file
+    """
+    if (np is not None and isinstance(obj, np.ndarray)
+            and obj.ndim == 2 and obj.shape[1] == 2):
+        return msgpack.ExtType(
+            _POINT_ARRAY_EXT, np.ascontiguousarray(obj, dtype="<f8").tobytes()
+        )
+    raise TypeError(
+        f"Object of type {type(obj).__name__} cannot be stored in a "
+        f"MessagePack drawing file"
+    )
+
+
+def _msgpack_ext_hook(code: int, data: bytes) -> Any:
+    """Decode the MessagePack extension types written by save_drawable.
+    
+    Args:
+        code: Extension type code
+        data: Extension payload
+        
+    Returns:
+        The decoded value, or the raw ExtType for unknown codes
+    """
+    if code == _TRANSFORM_EXT:
+        a, b, c, d, tx, ty = _TRANSFORM_STRUCT.unpack(data)
+        return Transform2D.model_construct(a=a, b=b, c=c, d=d, tx=tx, ty=ty)
+    if code == _POINT_ARRAY_EXT:
+        _require_numpy()
+        return np.frombuffer(data, dtype="<f8").astype(np.float64).reshape(-1, 2)
+    return msgpack.ExtType(code, data)
+
+
+def _is_msgpack_file(filename: str) -> bool:
+    """Check whether a path should be stored as MessagePack.
+    
+    Args:
+        filename: Path of the drawing file
+        
+    Returns:
+        True for .mpk/.msgpack paths and paths without a suffix
+    """
+    suffix = os.path.splitext(os.fspath(filename))[1].lower()
+    return suffix in _MSGPACK_SUFFIXES
+
+
+def _require_msgpack() -> None:
+    """Raise a helpful error if the optional msgpack dependency is missing."""
+    if msgpack is None:
+        raise ImportError(
+            "msgpack is required for binary drawing files; install "
+            "'claude-draw[msgpack]' or save with a .json suffix"
+        )
+
+
+def _require_numpy() -> None:
+    """Raise a helpful error if the optional numpy dependency is missing."""
+    if np is None:
+        raise ImportError(
+            "numpy is required for point arrays; install 'claude-draw[numpy]'"
+        )
+
+
+@contextmanager
+def _mapped(f: BinaryIO) -> Iterator[Union[mmap.mmap, bytes]]:
+    """Map an open file read-only, falling back to reading it.
+    
+    Parsers read the mapping in place, so the file contents are not first
+    copied into a Python bytes object.
     
-    Convenience function that reads a JSON file and deserializes it
+    Args:
+        f: File opened in binary mode
+        
+    Yields:
+        A read-only memory map of the file, or its bytes if it is empty
+    """
+    try:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError:
+        # Empty files cannot be mapped
+        yield f.read()
+        return
+    with mapped:
+        yield mapped
+
+
+def load_drawable(filename: str, trust_input: bool = False) -> "Drawable":
+    """Load a drawable object from a drawing file.
+    
+    Convenience function that reads a drawing file and deserializes it
     into Claude Draw objects with proper type restoration. Handles
     the complete loading process including file I/O and deserialization.
     
     File format expectations:
-    - Standard JSON with type discriminators
-    - UTF-8 encoding
+    - .json files: standard UTF-8 JSON with type discriminators
+    - .mpk/.msgpack files or no suffix: MessagePack encoding of the
+      same enhanced dictionary (requires the optional msgpack package)
     - Created by save_drawable() or compatible
     - Contains __type__ fields for objects
     
     Args:
-        filename: Path to the JSON file to load. File must exist
-            and contain valid JSON with type discriminators.
+        filename: Path to the file to load. File must exist and contain
+            data with type discriminators in the format implied by its suffix.
+        trust_input: Skip validation of current-version data, as in
+            deserialize_drawable(). Only pass True for files the
+            application saved itself with save_drawable().
         
     Returns:
         Drawable: Deserialized object with correct types restored.
@@ -532,8 +1184,11 @@ def load_drawable(filename: str) -> "Drawable":
     Raises:
         FileNotFoundError: If the specified file doesn't exist
         IOError: If file cannot be read
-        json.JSONDecodeError: If file contains invalid JSON
-        ValueError: If type discriminators are missing or unknown
+        ImportError: If a MessagePack file is loaded without msgpack installed
+        json.JSONDecodeError: If a JSON file contains invalid JSON that
+            mentions a type discriminator
+        ValueError: If type discriminators are missing or unknown,
+            including malformed JSON files that never mention one
         ValidationError: If data doesn't match expected schemas
         
     Example:
@@ -541,44 +1196,52 @@ def load_drawable(filename: str) -> "Drawable":
         >>> drawing = load_drawable("artwork.json")
         >>> print(f"Loaded {drawing.title}")
     """
-    with open(filename, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    return deserialize_drawable(data)
+    if _is_msgpack_file(filename):
+        _require_msgpack()
+        with open(filename, 'rb') as f, _mapped(f) as buffer:
+            data = msgpack.unpackb(buffer, raw=False, ext_hook=_msgpack_ext_hook)
+        return deserialize_drawable(data, trust_input)
+    
+    with open(filename, 'rb') as f, _mapped(f) as buffer:
+        return deserialize_drawable(buffer, trust_input)
 
 
 def save_drawable(obj: "Drawable", filename: str, **kwargs) -> None:
-    """Save a drawable object to a JSON file with type preservation.
+    """Save a drawable object to a file with type preservation.
     
     Convenience function that serializes Claude Draw objects and writes
-    them to disk in a human-readable JSON format. The output preserves
-    all type information for perfect reconstruction.
+    them to disk. The output preserves all type information for perfect
+    reconstruction. The format is chosen from the file suffix.
     
     Output characteristics:
-    - Pretty-printed JSON (2-space indent by default)
-    - UTF-8 encoding for international support
+    - .json: pretty-printed UTF-8 JSON (2-space indent by default),
+      clean formatting for version control
+    - .mpk/.msgpack or no suffix: compact MessagePack with numbers stored
+      in native binary form, which loads without text number parsing
     - Type discriminators for all Drawable objects
-    - Clean formatting for version control
     
     File handling:
     - Creates new file or overwrites existing
     - Atomic write would be ideal for production
     - Parent directory must exist
-    - Extension .json recommended
     
     Args:
         obj: Drawable object to save. Typically a Drawing object
             containing a complete scene, but can be any drawable.
-        filename: Path where the JSON file will be saved. Parent
+        filename: Path where the file will be saved. Parent
             directory must exist. File will be created or overwritten.
         **kwargs: Additional arguments for JSON encoder:
             - indent: Indentation spaces (default: 2)  
             - sort_keys: Sort keys alphabetically
             - ensure_ascii: Force ASCII output
             - include_version: Add version metadata
+            - batch_children: Store same-type child runs in columnar form
+            Only include_version and batch_children apply to MessagePack files.
     
     Raises:
         IOError: If file cannot be written
         OSError: If path is invalid or permissions denied
+        ImportError: If a MessagePack file is requested without msgpack installed
         
     Example:
         >>> drawing = Drawing(width=800, height=600, title="My Art")
@@ -586,8 +1249,29 @@ def save_drawable(obj: "Drawable", filename: str, **kwargs) -> None:
         >>> save_drawable(drawing, "my_art.json")
         >>> # Creates formatted JSON file with type info
     """
+    if _is_msgpack_file(filename):
+        _require_msgpack()
+        encoder = _MsgpackEncoder(
+            include_version=kwargs.get("include_version", True),
+            batch_children=kwargs.get("batch_children", False),
+        )
+        packed = msgpack.packb(
+            encoder._serialize_draw_model(obj),
+            use_bin_type=True,
+            default=_msgpack_default,
+        )
+        with open(filename, 'wb') as f:
+            f.write(packed)
+        return
+    
+    options = {"indent": 2, **kwargs}
     with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(obj, f, cls=EnhancedJSONEncoder, indent=2, **kwargs)
+        if options.keys() <= _STREAMING_OPTIONS:
+            # Write straight to the file without building the dict tree or
+            # the full JSON string first
+            StreamingEncoder(**options).encode_to(obj, f)
+        else:
+            json.dump(obj, f, cls=EnhancedJSONEncoder, **options)
 
 
 # Auto-register core drawable types
@@ -26,15 +26,26 @@ Design principles:
 - Methods return new instances to maintain immutability
 """
 
-from typing import Any
-from pydantic import Field, field_validator
+from typing import Annotated, Any
+from pydantic import Field, TypeAdapter
 import math
 
+from claude_draw import _shape_kernels
 from claude_draw.base import Primitive
 from claude_draw.models.point import Point2D
 from claude_draw.models.bounding_box import BoundingBox
 
 
+# Validates a single positive dimension. The with_* copy methods check only
+# the values they change with it instead of revalidating the whole model
+# (model_copy itself performs no validation at all).
+_POSITIVE = TypeAdapter(Annotated[float, Field(gt=0.0, strict=True)])
+
+# Module-level constants avoid a math attribute lookup per area/circumference.
+_PI = math.pi
+_TWO_PI = 2.0 * math.pi
+
+
 class Circle(Primitive):
     """A perfect circle shape defined by center point and radius.
     
@@ -80,14 +91,6 @@ class Circle(Primitive):
     center: Point2D = Field(description="Center point of the circle")
     radius: float = Field(gt=0.0, description="Radius of the circle (must be positive)")
     
-    @field_validator('radius')
-    @classmethod
-    def validate_radius(cls, v):
-        """Validate that radius is positive."""
-        if v <= 0:
-            raise ValueError("Circle radius must be positive")
-        return v
-    
     def get_bounds(self) -> BoundingBox:
         """Calculate the axis-aligned bounding box of the circle.
         
@@ -117,10 +120,20 @@ class Circle(Primitive):
         return BoundingBox(
             x=self.center.x - self.radius,
             y=self.center.y - self.radius,
-            width=2 * self.radius,
-            height=2 * self.radius
+            width=2.0 * self.radius,
+            height=2.0 * self.radius
         )
     
+    @property
+    def extents(self) -> tuple[float, float, float, float]:
+        """Edge coordinates of the circle.
+        
+        Returns:
+            tuple[float, float, float, float]: (min_x, min_y, max_x, max_y)
+        """
+        cx, cy, r = self.center.x, self.center.y, self.radius
+        return (cx - r, cy - r, cx + r, cy + r)
+    
     def accept(self, visitor) -> Any:
         """Accept a visitor for processing this circle.
         
@@ -151,8 +164,11 @@ class Circle(Primitive):
             
         Returns:
             Circle: New circle with updated radius
+            
+        Raises:
+            ValidationError: If radius is not positive
         """
-        return self.model_copy(update={"radius": radius})
+        return self.model_copy(update={"radius": _POSITIVE.validate_python(radius)})
     
     def contains_point(self, point: Point2D) -> bool:
         """Check if a point is inside the circle.
@@ -163,8 +179,21 @@ class Circle(Primitive):
         Returns:
             bool: True if point is inside or on the circle boundary
         """
-        distance = self.center.distance_to(point)
-        return distance <= self.radius
+        center = self.center
+        return _shape_kernels.circle_contains(center.x, center.y, self.radius, point.x, point.y)
+    
+    def contains_points(self, xs: Any, ys: Any) -> Any:
+        """Check many points against the circle in one vectorized pass.
+        
+        Args:
+            xs: NumPy array of x coordinates
+            ys: NumPy array of y coordinates, same shape as ``xs``
+            
+        Returns:
+            Boolean array, True where the point is inside or on the boundary
+        """
+        center = self.center
+        return _shape_kernels.circle_contains(center.x, center.y, self.radius, xs, ys)
     
     def area(self) -> float:
         """Calculate the area of the circle.
@@ -172,7 +201,7 @@ class Circle(Primitive):
         Returns:
             float: Area of the circle (π * r²)
         """
-        return math.pi * self.radius * self.radius
+        return _PI * self.radius * self.radius
     
     def circumference(self) -> float:
         """Calculate the circumference of the circle.
@@ -180,7 +209,7 @@ class Circle(Primitive):
         Returns:
             float: Circumference of the circle (2 * π * r)
         """
-        return 2 * math.pi * self.radius
+        return _TWO_PI * self.radius
     
     def scaled(self, factor: float) -> "Circle":
         """Create a new circle scaled by the given factor.
@@ -190,10 +219,16 @@ class Circle(Primitive):
             
         Returns:
             Circle: New circle with scaled radius
+            
+        Raises:
+            ValueError: If the factor is not positive
         """
-        if factor <= 0:
+        # One comparison on the product also rejects NaN and underflow to 0,
+        # so the positive-radius validator need not run again
+        radius = self.radius * factor
+        if not radius > 0:
             raise ValueError("Scale factor must be positive")
-        return self.with_radius(self.radius * factor)
+        return self.model_copy(update={"radius": radius})
 
 
 class Rectangle(Primitive):
@@ -256,22 +291,6 @@ class Rectangle(Primitive):
     width: float = Field(gt=0.0, description="Width of the rectangle (must be positive)")
     height: float = Field(gt=0.0, description="Height of the rectangle (must be positive)")
     
-    @field_validator('width')
-    @classmethod
-    def validate_width(cls, v):
-        """Validate that width is positive."""
-        if v <= 0:
-            raise ValueError("Rectangle width must be positive")
-        return v
-    
-    @field_validator('height')
-    @classmethod
-    def validate_height(cls, v):
-        """Validate that height is positive."""
-        if v <= 0:
-            raise ValueError("Rectangle height must be positive")
-        return v
-    
     def get_bounds(self) -> BoundingBox:
         """Calculate the bounding box of the rectangle.
         
@@ -285,6 +304,15 @@ class Rectangle(Primitive):
             height=self.height
         )
     
+    @property
+    def extents(self) -> tuple[float, float, float, float]:
+        """Edge coordinates of the rectangle.
+        
+        Returns:
+            tuple[float, float, float, float]: (min_x, min_y, max_x, max_y)
+        """
+        return (self.x, self.y, self.x + self.width, self.y + self.height)
+    
     def accept(self, visitor) -> Any:
         """Accept a visitor for processing this rectangle.
         
@@ -374,8 +402,14 @@ class Rectangle(Primitive):
             
         Returns:
             Rectangle: New rectangle with updated size
+            
+        Raises:
+            ValidationError: If width or height is not positive
         """
-        return self.model_copy(update={"width": width, "height": height})
+        return self.model_copy(update={
+            "width": _POSITIVE.validate_python(width),
+            "height": _POSITIVE.validate_python(height),
+        })
     
     def contains_point(self, point: Point2D) -> bool:
         """Check if a point is inside the rectangle.
@@ -389,6 +423,20 @@ class Rectangle(Primitive):
         return (self.x <= point.x <= self.x + self.width and
                 self.y <= point.y <= self.y + self.height)
     
+    def contains_points(self, xs: Any, ys: Any) -> Any:
+        """Check many points against the rectangle in one vectorized pass.
+        
+        Args:
+            xs: NumPy array of x coordinates
+            ys: NumPy array of y coordinates, same shape as ``xs``
+            
+        Returns:
+            Boolean array, True where the point is inside or on the boundary
+        """
+        return _shape_kernels.rectangle_contains(
+            self.x, self.y, self.width, self.height, xs, ys
+        )
+    
     def area(self) -> float:
         """Calculate the area of the rectangle.
         
@@ -474,22 +522,6 @@ class Ellipse(Primitive):
     rx: float = Field(gt=0.0, description="Horizontal radius (must be positive)")
     ry: float = Field(gt=0.0, description="Vertical radius (must be positive)")
     
-    @field_validator('rx')
-    @classmethod
-    def validate_rx(cls, v):
-        """Validate that horizontal radius is positive."""
-        if v <= 0:
-            raise ValueError("Ellipse horizontal radius must be positive")
-        return v
-    
-    @field_validator('ry')
-    @classmethod
-    def validate_ry(cls, v):
-        """Validate that vertical radius is positive."""
-        if v <= 0:
-            raise ValueError("Ellipse vertical radius must be positive")
-        return v
-    
     def get_bounds(self) -> BoundingBox:
         """Calculate the bounding box of the ellipse.
         
@@ -499,10 +531,20 @@ class Ellipse(Primitive):
         return BoundingBox(
             x=self.center.x - self.rx,
             y=self.center.y - self.ry,
-            width=2 * self.rx,
-            height=2 * self.ry
+            width=2.0 * self.rx,
+            height=2.0 * self.ry
         )
     
+    @property
+    def extents(self) -> tuple[float, float, float, float]:
+        """Edge coordinates of the ellipse.
+        
+        Returns:
+            tuple[float, float, float, float]: (min_x, min_y, max_x, max_y)
+        """
+        cx, cy = self.center.x, self.center.y
+        return (cx - self.rx, cy - self.ry, cx + self.rx, cy + self.ry)
+    
     def accept(self, visitor) -> Any:
         """Accept a visitor for processing this ellipse.
         
@@ -534,8 +576,14 @@ class Ellipse(Primitive):
             
         Returns:
             Ellipse: New ellipse with updated radii
+            
+        Raises:
+            ValidationError: If either radius is not positive
         """
-        return self.model_copy(update={"rx": rx, "ry": ry})
+        return self.model_copy(update={
+            "rx": _POSITIVE.validate_python(rx),
+            "ry": _POSITIVE.validate_python(ry),
+        })
     
     def contains_point(self, point: Point2D) -> bool:
         """Check if a point is inside the ellipse.
@@ -548,9 +596,23 @@ class Ellipse(Primitive):
         Returns:
             bool: True if point is inside or on the ellipse boundary
         """
-        dx = point.x - self.center.x
-        dy = point.y - self.center.y
-        return (dx * dx) / (self.rx * self.rx) + (dy * dy) / (self.ry * self.ry) <= 1.0
+        center = self.center
+        return _shape_kernels.ellipse_contains(
+            center.x, center.y, self.rx, self.ry, point.x, point.y
+        )
+    
+    def contains_points(self, xs: Any, ys: Any) -> Any:
+        """Check many points against the ellipse in one vectorized pass.
+        
+        Args:
+            xs: NumPy array of x coordinates
+            ys: NumPy array of y coordinates, same shape as ``xs``
+            
+        Returns:
+            Boolean array, True where the point is inside or on the boundary
+        """
+        center = self.center
+        return _shape_kernels.ellipse_contains(center.x, center.y, self.rx, self.ry, xs, ys)
     
     def area(self) -> float:
         """Calculate the area of the ellipse.
@@ -558,7 +620,7 @@ class Ellipse(Primitive):
         Returns:
             float: Area of the ellipse (π * rx * ry)
         """
-        return math.pi * self.rx * self.ry
+        return _PI * self.rx * self.ry
     
     def perimeter(self) -> float:
         """Calculate the approximate perimeter of the ellipse.
@@ -568,9 +630,7 @@ class Ellipse(Primitive):
         Returns:
             float: Approximate perimeter of the ellipse
         """
-        # Ramanujan's approximation: π * (3(a+b) - sqrt((3a+b)(a+3b)))
-        a, b = self.rx, self.ry
-        return math.pi * (3 * (a + b) - math.sqrt((3 * a + b) * (a + 3 * b)))
+        return _shape_kernels.ellipse_perimeter(self.rx, self.ry)
     
     def is_circle(self) -> bool:
         """Check if the ellipse is a circle.
@@ -589,14 +649,20 @@ class Ellipse(Primitive):
             
         Returns:
             Ellipse: New ellipse with scaled radii
+            
+        Raises:
+            ValueError: If either factor is not positive
         """
         if factor_y is None:
             factor_y = factor_x
         
-        if factor_x <= 0 or factor_y <= 0:
+        # As in Circle.scaled, checking the products covers NaN and underflow
+        rx = self.rx * factor_x
+        ry = self.ry * factor_y
+        if not (rx > 0 and ry > 0):
             raise ValueError("Scale factors must be positive")
         
-        return self.with_radii(self.rx * factor_x, self.ry * factor_y)
+        return self.model_copy(update={"rx": rx, "ry": ry})
 
 
 class Line(Primitive):
@@ -671,18 +737,31 @@ class Line(Primitive):
         Returns:
             BoundingBox: The bounding box containing the line
         """
-        min_x = min(self.start.x, self.end.x)
-        max_x = max(self.start.x, self.end.x)
-        min_y = min(self.start.y, self.end.y)
-        max_y = max(self.start.y, self.end.y)
+        start, end = self.start, self.end
+        sx, sy, ex, ey = start.x, start.y, end.x, end.y
         
         return BoundingBox(
-            x=min_x,
-            y=min_y,
-            width=max_x - min_x,
-            height=max_y - min_y
+            x=sx if sx < ex else ex,
+            y=sy if sy < ey else ey,
+            width=abs(ex - sx),
+            height=abs(ey - sy)
         )
     
+    @property
+    def extents(self) -> tuple[float, float, float, float]:
+        """Edge coordinates of the line.
+        
+        Returns:
+            tuple[float, float, float, float]: (min_x, min_y, max_x, max_y)
+        """
+        start, end = self.start, self.end
+        sx, sy, ex, ey = start.x, start.y, end.x, end.y
+        if sx > ex:
+            sx, ex = ex, sx
+        if sy > ey:
+            sy, ey = ey, sy
+        return (sx, sy, ex, ey)
+    
     def accept(self, visitor) -> Any:
         """Accept a visitor for processing this line.
         
@@ -716,13 +795,26 @@ class Line(Primitive):
         """
         return self.model_copy(update={"end": end})
     
+    @property
+    def delta(self) -> tuple[float, float]:
+        """Direction vector from start to end.
+        
+        Shared by the measurements that need both components: length,
+        slope, angle and the zero-length check.
+        
+        Returns:
+            tuple[float, float]: (end.x - start.x, end.y - start.y)
+        """
+        start, end = self.start, self.end
+        return (end.x - start.x, end.y - start.y)
+    
     def length(self) -> float:
         """Calculate the length of the line.
         
         Returns:
             float: Length of the line
         """
-        return self.start.distance_to(self.end)
+        return math.hypot(*self.delta)
     
     def midpoint(self) -> Point2D:
         """Calculate the midpoint of the line.
@@ -744,10 +836,11 @@ class Line(Primitive):
         Raises:
             ValueError: If the line is vertical (infinite slope)
         """
-        if abs(self.end.x - self.start.x) < 1e-10:
+        dx, dy = self.delta
+        if abs(dx) < 1e-10:
             raise ValueError("Vertical line has infinite slope")
         
-        return (self.end.y - self.start.y) / (self.end.x - self.start.x)
+        return dy / dx
     
     def angle(self) -> float:
         """Calculate the angle of the line in radians.
@@ -755,7 +848,8 @@ class Line(Primitive):
         Returns:
             float: Angle from start to end point in radians
         """
-        return math.atan2(self.end.y - self.start.y, self.end.x - self.start.x)
+        dx, dy = self.delta
+        return math.atan2(dy, dx)
     
     def is_horizontal(self) -> bool:
         """Check if the line is horizontal.
@@ -779,4 +873,4 @@ class Line(Primitive):
         Returns:
             bool: True if start and end are the same point
         """
-        return self.start.distance_to(self.end) < 1e-10
\ No newline at end of file
+        return math.hypot(*self.delta) < 1e-10
\ No newline at end of file
@@ -1,25 +1,77 @@
 """Visitor pattern implementation for Claude Draw."""
 
+import math
+import operator
 from abc import ABC, abstractmethod
-from typing import Any, List, Optional, Dict, TYPE_CHECKING
+from typing import Any, Callable, Iterable, List, Optional, Dict, TYPE_CHECKING
 from dataclasses import dataclass, field
 
+from pydantic import ConfigDict
+
 from claude_draw.models.transform import Transform2D
 from claude_draw.models.color import Color
 from claude_draw.protocols import DrawableVisitor
+from claude_draw.shapes import Circle, Rectangle, Line, Ellipse
+from claude_draw.containers import Group, Layer, Drawing
 
 if TYPE_CHECKING:
-    from claude_draw.shapes import Circle, Rectangle, Line, Ellipse
-    from claude_draw.containers import Group, Layer, Drawing
     from claude_draw.base import Drawable
 
 
+# Reads a transform's six matrix entries; used to key composed transforms
+_matrix_values = operator.attrgetter("a", "b", "c", "d", "tx", "ty")
+
+# Maximum number of composed transforms remembered by one RenderContext
+_COMPOSE_CACHE_SIZE = 256
+
+
+class _FrozenTransform(Transform2D):
+    """Transform2D that rejects assignment.
+    
+    RenderContext memoizes composed matrices and hands the same instance to
+    every push that hits the cache, across renders. Freezing them turns an
+    accidental ``current_transform.tx = 0`` into an error instead of a
+    silently wrong matrix in every later render.
+    """
+    
+    model_config = ConfigDict(frozen=True)
+
+
+def _compose(values: tuple) -> Optional[Transform2D]:
+    """Multiply two matrices given as twelve flat entries.
+    
+    Args:
+        values: Entries of the outer then the inner transform, in
+            ``a, b, c, d, tx, ty`` order
+        
+    Returns:
+        Optional[Transform2D]: The frozen product, or None if any entry
+        overflowed (callers fall back to ``Transform2D.__mul__`` to report
+        the error)
+    """
+    a1, b1, c1, d1, tx1, ty1, a2, b2, c2, d2, tx2, ty2 = values
+    a = a1 * a2 + c1 * b2
+    b = b1 * a2 + d1 * b2
+    c = a1 * c2 + c1 * d2
+    d = b1 * c2 + d1 * d2
+    tx = a1 * tx2 + c1 * ty2 + tx1
+    ty = b1 * tx2 + d1 * ty2 + ty1
+    if not all(map(math.isfinite, (a, b, c, d, tx, ty))):
+        return None
+    return _FrozenTransform(a=a, b=b, c=c, d=d, tx=tx, ty=ty)
+
+
 @dataclass
 class RenderState:
     """Represents the current rendering state.
     
     This class encapsulates all the rendering attributes that can be
     inherited or modified during the rendering process.
+    
+    Note:
+        RenderContext snapshots ``opacity`` when a state is pushed, so
+        changing it on a state already on the stack does not affect
+        ``get_effective_opacity()``. Push a new state instead.
     """
     
     # Transformation matrix
@@ -60,9 +112,25 @@ class RenderContext:
     
     def __init__(self):
         """Initialize the render context with default state."""
-        self._transform_stack: List[Transform2D] = [Transform2D()]
+        self._transform_stack: List[Transform2D] = [_FrozenTransform()]
         self._state_stack: List[RenderState] = [RenderState()]
-        
+        # Composed transforms keyed by the entries of both factors, so
+        # repeated subtrees reuse the product instead of multiplying again
+        self._compose_cache: Dict[tuple, Transform2D] = {}
+        # Running product of the opacities on the state stack, one entry
+        # per state, so the effective opacity is a single lookup
+        self._opacity_stack: List[float] = [self._state_stack[0].opacity]
+        
+    def reset(self) -> None:
+        """Unwind every stack to its base entry.
+        
+        Composed transforms stay cached, so a context reused across renders
+        keeps the products it has already computed.
+        """
+        del self._transform_stack[1:]
+        del self._state_stack[1:]
+        del self._opacity_stack[1:]
+    
     @property
     def current_transform(self) -> Transform2D:
         """Get the current transformation matrix.
@@ -77,7 +145,8 @@ class RenderContext:
         """Get the current rendering state.
         
         Returns:
-            RenderState: The current rendering state
+            RenderState: The current rendering state. Its opacity was
+                captured when it was pushed; see push_state()
         """
         return self._state_stack[-1]
     
@@ -85,13 +154,26 @@ class RenderContext:
         """Push a new transformation onto the stack.
         
         The new transformation is combined with the current transformation
-        to create a cumulative effect.
+        to create a cumulative effect. Identity transforms reuse the current
+        matrix, and products are memoized per context, so stack entries may
+        be shared; they are frozen, and assigning to one raises.
         
         Args:
             transform: The transformation to apply
         """
         current = self._transform_stack[-1]
-        new_transform = current * transform
+        if transform.is_identity():
+            self._transform_stack.append(current)
+            return
+        
+        key = _matrix_values(current) + _matrix_values(transform)
+        cache = self._compose_cache
+        new_transform = cache.get(key)
+        if new_transform is None:
+            if len(cache) >= _COMPOSE_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del cache[next(iter(cache))]
+            new_transform = cache[key] = _compose(key) or current * transform
         self._transform_stack.append(new_transform)
     
     def pop_transform(self) -> Transform2D:
@@ -110,6 +192,11 @@ class RenderContext:
     def push_state(self, **updates) -> None:
         """Push a new rendering state onto the stack.
         
+        The state's opacity is multiplied into the running product here, at
+        push time. Later assignments to the pushed state's ``opacity`` are
+        not seen by get_effective_opacity(); pass the value in ``updates``
+        or push another state instead.
+        
         Args:
             **updates: State properties to update from current state
         """
@@ -122,6 +209,7 @@ class RenderContext:
                 setattr(new_state, key, value)
         
         self._state_stack.append(new_state)
+        self._opacity_stack.append(self._opacity_stack[-1] * new_state.opacity)
     
     def pop_state(self) -> RenderState:
         """Pop the current rendering state from the stack.
@@ -134,6 +222,7 @@ class RenderContext:
         """
         if len(self._state_stack) <= 1:
             raise ValueError("Cannot pop base rendering state")
+        self._opacity_stack.pop()
         return self._state_stack.pop()
     
     def push(self, transform: Optional[Transform2D] = None, **state_updates) -> None:
@@ -146,8 +235,8 @@ class RenderContext:
         if transform is not None:
             self.push_transform(transform)
         else:
-            # Push identity transform to keep stacks in sync
-            self.push_transform(Transform2D())
+            # Repeat the current transform to keep stacks in sync
+            self._transform_stack.append(self._transform_stack[-1])
             
         self.push_state(**state_updates)
     
@@ -164,13 +253,14 @@ class RenderContext:
     def get_effective_opacity(self) -> float:
         """Calculate the effective opacity from all states in the stack.
         
+        The product is maintained as states are pushed and popped, using
+        each state's opacity at the time it was pushed. Opacity changed on
+        a state after it was pushed is not reflected.
+        
         Returns:
             float: The combined opacity value
         """
-        opacity = 1.0
-        for state in self._state_stack:
-            opacity *= state.opacity
-        return opacity
+        return self._opacity_stack[-1]
     
     def is_visible(self) -> bool:
         """Check if the current object should be visible.
@@ -192,6 +282,17 @@ class BaseRenderer(DrawableVisitor, ABC):
         """Initialize the base renderer."""
         self.context = RenderContext()
         self._output: List[str] = []
+        # Bound visit methods for the built-in drawable types. Other types,
+        # including subclasses that may override accept(), go through accept().
+        self._dispatch: Dict[type, Callable[[Any], Any]] = {
+            Circle: self.visit_circle,
+            Rectangle: self.visit_rectangle,
+            Line: self.visit_line,
+            Ellipse: self.visit_ellipse,
+            Group: self.visit_group,
+            Layer: self.visit_layer,
+            Drawing: self.visit_drawing,
+        }
     
     def render(self, drawable: "Drawable") -> str:
         """Render a drawable object and return the output.
@@ -206,12 +307,26 @@ class BaseRenderer(DrawableVisitor, ABC):
         self.begin_render()
         
         try:
-            drawable.accept(self)
+            self._visit_children((drawable,))
         finally:
             self.end_render()
         
         return self.get_output()
     
+    def _visit_children(self, children: Iterable["Drawable"]) -> None:
+        """Visit drawables in order, dispatching on their exact type.
+        
+        Args:
+            children: The drawable objects to visit
+        """
+        dispatch = self._dispatch.get
+        for child in children:
+            visit = dispatch(type(child))
+            if visit is None:
+                child.accept(self)
+            else:
+                visit(child)
+    
     @abstractmethod
     def begin_render(self) -> None:
         """Initialize the rendering process.
@@ -291,9 +406,8 @@ class BaseRenderer(DrawableVisitor, ABC):
         try:
             # Visit children sorted by z-index
             children = group.get_children_sorted() if hasattr(group, 'get_children_sorted') else group.children
-            for child in children:
-                if self.context.is_visible():
-                    child.accept(self)
+            if self.context.is_visible():
+                self._visit_children(children)
         finally:
             self.context.pop()
         
@@ -323,8 +437,7 @@ class BaseRenderer(DrawableVisitor, ABC):
             if layer.visible and self.context.is_visible():
                 # Visit children sorted by z-index
                 children = sorted(layer.children, key=lambda child: getattr(child, 'z_index', 0))
-                for child in children:
-                    child.accept(self)
+                self._visit_children(children)
         finally:
             self.context.pop()
         
@@ -347,8 +460,7 @@ class BaseRenderer(DrawableVisitor, ABC):
         
         try:
             # Visit all children
-            for child in drawing.children:
-                child.accept(self)
+            self._visit_children(drawing.children)
         finally:
             self.context.pop()
         
@@ -70,4 +70,4 @@ class TestDrawModel:
         """Test that strict mode is enabled."""
         # Strict mode should not coerce types
         with pytest.raises(PydanticValidationError):
-            TestModel(name="test", value="42")  # type: ignore
\ No newline at end of file
+            TestModel(name="test", value="42")  # type: ignore
@@ -3,7 +3,7 @@
 import pytest
 from pydantic import ValidationError
 
-from claude_draw.models.color import Color
+from claude_draw.models.color import Color, _hex_to_int
 
 
 class TestColor:
@@ -86,6 +86,18 @@ class TestColor:
         assert color4.r == 170
         assert color4.g == 187
         assert color4.b == 204
+
+    @pytest.mark.parametrize("hex_string", ["0x1234", "-FFFFF", "+FFFFF", "FF_FF0", " FFFF0"])
+    def test_hex_to_int_rejects_non_digits(self, hex_string):
+        """Test that only hex digits are accepted when parsing."""
+        with pytest.raises(ValueError):
+            _hex_to_int(hex_string)
+
+    @pytest.mark.parametrize("hex_string", ["-FFFFF", "0x1234", "#GG0000", 0xFF0000])
+    def test_from_hex_invalid(self, hex_string):
+        """Test that malformed hex input never produces a Color."""
+        with pytest.raises(ValueError):
+            Color.from_hex(hex_string)
     
     def test_from_hsl(self):
         """Test creating color from HSL values."""
@@ -157,6 +169,18 @@ class TestColor:
         # Different color
         color3 = Color(r=170, g=187, b=204)
         assert color3.to_hex() == "#AABBCC"
+
+    def test_hex_cache_follows_mutation(self):
+        """Test that cached hex conversions track the current channels."""
+        color = Color.from_hex("#FF0000")
+        assert color.to_hex() == "#FF0000"
+
+        color.g = 16
+        assert color.to_hex() == "#FF1000"
+
+        # Instances parsed from the same string are independent
+        assert Color.from_hex("#FF0000") is not Color.from_hex("#FF0000")
+        assert Color.from_hex("#FF0000").to_hex() == "#FF0000"
     
     def test_to_rgb(self):
         """Test getting RGB tuple."""
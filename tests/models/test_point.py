@@ -53,6 +53,10 @@ class TestPoint2D:
         p = Point2D.origin()
         assert p.x == 0.0
         assert p.y == 0.0
+        
+        # Points are mutable, so each call must hand out its own instance
+        p.x = 5.0
+        assert Point2D.origin().x == 0.0
     
     def test_string_representation(self):
         """Test string representations."""
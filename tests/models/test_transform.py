@@ -248,6 +248,13 @@ class TestTransform2D:
         identity = Transform2D.identity()
         assert not identity.is_translation()
     
+    def test_is_axis_aligned(self):
+        """Test axis-aligned check."""
+        assert Transform2D.identity().is_axis_aligned()
+        assert Transform2D(a=-2.0, d=3.0, tx=5.0, ty=-1.0).is_axis_aligned()
+        assert not Transform2D.identity().rotate(0.5).is_axis_aligned()
+        assert not Transform2D(c=0.5).is_axis_aligned()
+    
     def test_is_scaling(self):
         """Test scaling check."""
         scaling = Transform2D(a=2.0, d=3.0)
@@ -61,6 +61,12 @@ class TestDrawable:
         assert isinstance(drawable.id, str)
         assert len(drawable.id) > 0
         
+        # Check that the ID is a canonical version 4 UUID
+        parsed = UUID(drawable.id)
+        assert str(parsed) == drawable.id
+        assert parsed.version == 4
+        assert ConcreteDrawable().id != drawable.id
+        
         # Check that transform is default identity
         assert drawable.transform == Transform2D()
         
@@ -187,6 +193,18 @@ class TestDrawable:
         result = drawable.accept("mock_visitor")
         
         assert result == "accepted"
+    
+    def test_drawable_equality(self):
+        """Test field-based equality, ignoring values cached on the instance."""
+        drawable = ConcreteDrawable(id="same")
+        same = ConcreteDrawable(id="same")
+        same.__dict__["cached"] = "derived value"
+        
+        assert drawable == same
+        assert hash(drawable) == hash(same)
+        assert drawable != ConcreteDrawable(id="other")
+        assert drawable != ConcretePrimitive(id="same")
+        assert drawable != "same"
 
 
 class TestStyleMixin:
@@ -0,0 +1,61 @@
+"""Tests for structure-of-arrays shape batches."""
+
+import math
+
+import pytest
+
+from claude_draw.batches import CircleBatch
+from claude_draw.models.point import Point2D
+from claude_draw.shapes import Circle
+
+np = pytest.importorskip("numpy")
+
+
+CIRCLES = [
+    Circle(center=Point2D(x=0, y=0), radius=5),
+    Circle(center=Point2D(x=10, y=-4), radius=2.5),
+    Circle(center=Point2D(x=-3, y=7), radius=1),
+]
+
+
+class TestCircleBatch:
+    """Test cases for CircleBatch."""
+
+    def test_from_iter(self):
+        """Test that shapes are copied into parallel arrays in order."""
+        batch = CircleBatch.from_iter(CIRCLES)
+        assert len(batch) == 3
+        assert batch.cx.tolist() == [0.0, 10.0, -3.0]
+        assert batch.cy.tolist() == [0.0, -4.0, 7.0]
+        assert batch.r.tolist() == [5.0, 2.5, 1.0]
+
+    def test_from_empty_iter(self):
+        """Test that an empty input gives an empty batch."""
+        batch = CircleBatch.from_iter([])
+        assert len(batch) == 0
+        assert batch.bounds().shape == (0, 4)
+
+    def test_mismatched_lengths(self):
+        """Test that field arrays must share one length."""
+        with pytest.raises(ValueError):
+            CircleBatch(cx=[0.0, 1.0], cy=[0.0], r=[1.0, 1.0])
+
+    def test_areas_match_shapes(self):
+        """Test vectorized areas against Circle.area."""
+        areas = CircleBatch.from_iter(CIRCLES).areas()
+        for area, circle in zip(areas, CIRCLES):
+            assert math.isclose(area, circle.area())
+
+    def test_bounds_match_shapes(self):
+        """Test vectorized bounds against Circle.get_bounds."""
+        bounds = CircleBatch.from_iter(CIRCLES).bounds()
+        for row, circle in zip(bounds, CIRCLES):
+            box = circle.get_bounds()
+            assert row.tolist() == [box.x, box.y, box.width, box.height]
+
+    def test_contains_point(self):
+        """Test hit-testing one point against every circle."""
+        batch = CircleBatch.from_iter(CIRCLES)
+        assert batch.contains_point(0.0, 5.0).tolist() == [True, False, False]
+        assert batch.contains_point(-3.0, 6.5).tolist() == [False, False, True]
+        assert not batch.contains_point(100.0, 100.0).any()
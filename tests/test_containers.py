@@ -123,6 +123,25 @@ class TestGroup:
         assert bounds.y == 5  # min y
         assert bounds.width == 25  # max_x - min_x = 30 - 5
         assert bounds.height == 25  # max_y - min_y = 30 - 5
+    
+    def test_get_bounds_fresh(self):
+        """Test that the union tracks child changes and is never shared."""
+        circle = Circle(center=Point2D(x=10, y=10), radius=5)
+        group = Group().add_child(circle)
+        
+        bounds = group.get_bounds()
+        assert bounds is not group.get_bounds()
+        bounds.width = 100
+        assert group.get_bounds().width == 10
+        
+        bigger = group.add_child(Rectangle(x=20, y=20, width=10, height=10))
+        assert bigger.get_bounds().width == 25
+        assert bigger.remove_child(circle.id).get_bounds().x == 20
+        assert group.get_bounds().width == 10
+        
+        # Mutating a child's nested geometry is reflected on the next call
+        circle.center.x = 0
+        assert group.get_bounds().x == -5
 
 
 class TestLayer:
@@ -1,5 +1,6 @@
 """Tests for serialization functionality."""
 
+import io
 import json
 import pytest
 import tempfile
@@ -10,7 +11,7 @@ from claude_draw.serialization import (
     serialize_drawable, deserialize_drawable, deserialize_with_references,
     load_drawable, save_drawable, register_drawable_type, 
     get_drawable_class, get_type_discriminator,
-    EnhancedJSONEncoder, SerializationRegistry
+    EnhancedJSONEncoder, SerializationRegistry, StreamingEncoder
 )
 from claude_draw.shapes import Circle, Rectangle, Line, Ellipse
 from claude_draw.containers import Group, Layer, Drawing
@@ -99,87 +100,60 @@ class TestEnhancedJSONEncoder:
         assert serialized["opacity"] == 0.8
 
 
+_CIRCLE = Circle(
+    center=Point2D(x=100, y=200),
+    radius=50,
+    fill=Color.from_hex("#FF0000")
+)
+_RECT = Rectangle(
+    x=10, y=20, width=30, height=40,
+    stroke=Color.from_hex("#000000"),
+    stroke_width=3.0
+)
+_LINE = Line(
+    start=Point2D(x=0, y=0),
+    end=Point2D(x=100, y=100),
+    stroke=Color.from_hex("#0000FF")
+)
+_ELLIPSE = Ellipse(
+    center=Point2D(x=50, y=75),
+    rx=30, ry=20,
+    fill=Color.from_hex("#00FF00"),
+    opacity=0.6
+)
+
+
+@pytest.fixture(scope="session")
+def shared_encoder():
+    """One encoder reused by every round-trip test in the session."""
+    return EnhancedJSONEncoder()
+
+
 class TestBasicSerialization:
     """Test cases for basic serialization/deserialization."""
     
-    def test_circle_round_trip(self):
-        """Test circle serialization round trip."""
-        original = Circle(
-            center=Point2D(x=100, y=200), 
-            radius=50,
-            fill=Color.from_hex("#FF0000")
-        )
-        
-        # Serialize
-        json_str = serialize_drawable(original)
+    @pytest.mark.parametrize(
+        "original",
+        [_CIRCLE, _RECT, _LINE, _ELLIPSE],
+        ids=["circle", "rect", "line", "ellipse"],
+    )
+    def test_shape_round_trip(self, original, shared_encoder):
+        """Test shape serialization round trip."""
+        json_str = serialize_drawable(original, encoder=shared_encoder)
         assert isinstance(json_str, str)
         
-        # Deserialize
-        restored = deserialize_drawable(json_str)
-        
-        # Verify
-        assert isinstance(restored, Circle)
-        assert restored.center.x == 100
-        assert restored.center.y == 200
-        assert restored.radius == 50
-        assert restored.fill.to_hex() == "#FF0000"
-    
-    def test_rectangle_round_trip(self):
-        """Test rectangle serialization round trip."""
-        original = Rectangle(
-            x=10, y=20, width=30, height=40,
-            stroke=Color.from_hex("#000000"),
-            stroke_width=3.0
-        )
-        
-        json_str = serialize_drawable(original)
-        restored = deserialize_drawable(json_str)
-        
-        assert isinstance(restored, Rectangle)
-        assert restored.x == 10
-        assert restored.y == 20
-        assert restored.width == 30
-        assert restored.height == 40
-        assert restored.stroke.to_hex() == "#000000"
-        assert restored.stroke_width == 3.0
-    
-    def test_line_round_trip(self):
-        """Test line serialization round trip."""
-        original = Line(
-            start=Point2D(x=0, y=0),
-            end=Point2D(x=100, y=100),
-            stroke=Color.from_hex("#0000FF")
-        )
-        
-        json_str = serialize_drawable(original)
         restored = deserialize_drawable(json_str)
         
-        assert isinstance(restored, Line)
-        assert restored.start.x == 0
-        assert restored.start.y == 0
-        assert restored.end.x == 100
-        assert restored.end.y == 100
-        assert restored.stroke.to_hex() == "#0000FF"
+        assert type(restored) is type(original)
+        assert restored == original
     
-    def test_ellipse_round_trip(self):
-        """Test ellipse serialization round trip."""
-        original = Ellipse(
-            center=Point2D(x=50, y=75),
-            rx=30, ry=20,
-            fill=Color.from_hex("#00FF00"),
-            opacity=0.6
-        )
-        
-        json_str = serialize_drawable(original)
-        restored = deserialize_drawable(json_str)
+    def test_reused_encoder_does_not_leak_references(self, shared_encoder):
+        """Test that a reused encoder starts each document afresh."""
+        first = serialize_drawable(_CIRCLE, encoder=shared_encoder)
+        second = serialize_drawable(_CIRCLE, encoder=shared_encoder)
         
-        assert isinstance(restored, Ellipse)
-        assert restored.center.x == 50
-        assert restored.center.y == 75
-        assert restored.rx == 30
-        assert restored.ry == 20
-        assert restored.fill.to_hex() == "#00FF00"
-        assert restored.opacity == 0.6
+        assert first == second
+        assert "__ref__" not in second
 
 
 class TestContainerSerialization:
@@ -282,6 +256,17 @@ class TestErrorHandling:
         with pytest.raises(ValueError, match="Missing type discriminator"):
             deserialize_drawable(data)
     
+    def test_deserialize_missing_type_rejected_before_parsing(self):
+        """Test that untyped JSON text is rejected without a full parse."""
+        # Truncated text would fail to parse; the marker scan fires first.
+        with pytest.raises(ValueError, match="not a typed drawable") as info:
+            deserialize_drawable('{"center": {"x": 0, "y": 0}, "radius": ')
+        assert "invalid JSON" in str(info.value)
+
+        # Malformed text that mentions the discriminator reaches the parser
+        with pytest.raises(json.JSONDecodeError):
+            deserialize_drawable('{"__type__": "Circle", bad')
+
     def test_deserialize_unknown_type(self):
         """Test deserializing data with unknown type."""
         data = {
@@ -305,19 +290,138 @@ class TestErrorHandling:
         with pytest.raises(ValueError, match="Cannot deserialize reference without context"):
             deserialize_drawable(data)
 
+    def test_unversioned_data_is_validated(self):
+        """Test that data without a schema version is still validated."""
+        data = {"__type__": "Circle", "center": {"x": 0, "y": 0}, "radius": -5.0}
+
+        with pytest.raises(ValueError):
+            deserialize_drawable(data)
+
+    def test_untrusted_versioned_data_is_validated(self):
+        """Test that trust_input=False validates even versioned data."""
+        data = {
+            "__type__": "Circle",
+            "__version__": "1.0",
+            "center": {"x": 0, "y": 0},
+            "radius": -5.0,
+        }
+
+        with pytest.raises(ValueError):
+            deserialize_drawable(data, trust_input=False)
+
+
+class TestTrustedDeserialization:
+    """Test cases for the unvalidated fast path on versioned data."""
+
+    def test_version_stamp_alone_is_not_trusted(self):
+        """Test that a client-supplied version stamp does not skip validation."""
+        data = {
+            "__type__": "Circle",
+            "__version__": "1.0",
+            "center": [1, 2],
+            "radius": "big",
+        }
+
+        with pytest.raises(ValueError):
+            deserialize_drawable(data)
+
+    def test_trusted_matches_validated(self):
+        """Test that trusted and validated deserialization agree."""
+        drawing = Drawing(
+            width=400,
+            height=300,
+            children=[
+                Layer(name="bg", children=[
+                    Group(children=[
+                        Circle(center=Point2D(x=1.0, y=2.0), radius=3.0,
+                               fill=Color(r=255, g=0, b=0)),
+                        Line(start=Point2D(x=0.0, y=0.0), end=Point2D(x=5.0, y=5.0),
+                             transform=Transform2D(tx=4.0)),
+                    ])
+                ])
+            ],
+        )
+        json_str = serialize_drawable(drawing)
+
+        trusted = deserialize_drawable(json_str, trust_input=True)
+        validated = deserialize_drawable(json_str)
+
+        assert trusted == validated
+        circle = trusted.children[0].children[0].children[0]
+        assert isinstance(circle.center, Point2D)
+        assert isinstance(circle.fill, Color)
+        assert isinstance(trusted.children[0].children[0].children[1].transform, Transform2D)
+
+
+class TestBufferInput:
+    """Test cases for deserializing raw UTF-8 buffers."""
+
+    @pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview], ids=["bytes", "bytearray", "memoryview"])
+    def test_deserialize_from_buffer(self, wrap):
+        """Test that JSON bytes deserialize like the equivalent string."""
+        circle = Circle(center=Point2D(x=1, y=2), radius=3)
+        payload = wrap(serialize_drawable(circle).encode("utf-8"))
+
+        assert deserialize_drawable(payload) == circle
+        assert deserialize_with_references(payload) == circle
+
+    def test_load_empty_file(self):
+        """Test that an empty file still fails as invalid JSON."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix=".json", delete=False) as f:
+            filename = f.name
+
+        try:
+            with pytest.raises(json.JSONDecodeError):
+                load_drawable(filename)
+        finally:
+            os.unlink(filename)
+
+
+class TestStreamingEncoder:
+    """Test cases for StreamingEncoder."""
+
+    @pytest.mark.parametrize(
+        "options",
+        [{}, {"indent": 2}, {"include_version": False, "indent": "\t"}, {"ensure_ascii": False}],
+        ids=["compact", "indent", "tab-no-version", "unicode"],
+    )
+    def test_matches_enhanced_encoder(self, options):
+        """Test that streamed text is identical to json.dumps output."""
+        shared = Circle(center=Point2D(x=1.5, y=-2), radius=3, fill=Color(r=1, g=2, b=3, a=0.5))
+        drawing = Drawing(width=200, height=100, title="Caf\u00e9").add_child(
+            Layer(name="main").add_child(Group(children=[shared, shared, Group()]))
+        )
+
+        expected = json.dumps(drawing, cls=EnhancedJSONEncoder, **options)
+
+        assert StreamingEncoder(**options).encode(drawing) == expected
+
+    def test_encode_to_stream(self):
+        """Test writing directly into a text stream."""
+        rect = Rectangle(x=0, y=0, width=10, height=5)
+        buffer = io.StringIO()
+
+        StreamingEncoder(indent=2).encode_to(rect, buffer)
+
+        assert deserialize_drawable(buffer.getvalue()) == rect
+
 
 class TestFileSerialization:
     """Test cases for file-based serialization."""
     
-    def test_save_and_load_drawable(self):
+    @pytest.mark.parametrize("suffix", [".json", ".mpk"])
+    def test_save_and_load_drawable(self, suffix):
         """Test saving and loading drawable from file."""
+        if suffix == ".mpk":
+            pytest.importorskip("msgpack")
+        
         original = Circle(
             center=Point2D(x=50, y=50),
             radius=25,
             fill=Color.from_hex("#FF0000")
         )
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+        with tempfile.NamedTemporaryFile(mode='w', suffix=suffix, delete=False) as f:
             filename = f.name
         
         try:
@@ -327,6 +431,7 @@ class TestFileSerialization:
             
             # Load
             restored = load_drawable(filename)
+            assert load_drawable(filename, trust_input=True) == restored
             
             # Verify
             assert isinstance(restored, Circle)
@@ -340,8 +445,12 @@ class TestFileSerialization:
             if os.path.exists(filename):
                 os.unlink(filename)
     
-    def test_save_complex_drawing(self):
+    @pytest.mark.parametrize("suffix", [".json", ".mpk"])
+    def test_save_complex_drawing(self, suffix):
         """Test saving and loading complex drawing."""
+        if suffix == ".mpk":
+            pytest.importorskip("msgpack")
+        
         # Create a complex drawing
         circle = Circle(center=Point2D(x=25, y=25), radius=10, fill=Color.from_hex("#FF0000"))
         rect = Rectangle(x=10, y=10, width=30, height=20, stroke=Color.from_hex("#000000"))
@@ -354,7 +463,7 @@ class TestFileSerialization:
             title="Complex Drawing"
         ).add_child(layer)
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+        with tempfile.NamedTemporaryFile(mode='w', suffix=suffix, delete=False) as f:
             filename = f.name
         
         try:
@@ -362,12 +471,13 @@ class TestFileSerialization:
             save_drawable(drawing, filename)
             
             # Verify file contents
-            with open(filename, 'r') as f:
-                data = json.load(f)
-            
-            assert data["__type__"] == "Drawing"
-            assert data["title"] == "Complex Drawing"
-            assert len(data["children"]) == 1
+            if suffix == ".json":
+                with open(filename, 'r') as f:
+                    data = json.load(f)
+                
+                assert data["__type__"] == "Drawing"
+                assert data["title"] == "Complex Drawing"
+                assert len(data["children"]) == 1
             
             # Load
             restored = load_drawable(filename)
@@ -386,11 +496,101 @@ class TestFileSerialization:
             assert isinstance(group, Group)
             assert group.name == "shapes"
             assert len(group.children) == 2
-            
+
+        finally:
+            if os.path.exists(filename):
+                os.unlink(filename)
+
+    @pytest.mark.parametrize("suffix", [".json", ".mpk"])
+    def test_save_batched_children(self, suffix):
+        """Test that batched same-type children round-trip through a file."""
+        if suffix == ".mpk":
+            pytest.importorskip("msgpack")
+
+        circles = [
+            Circle(center=Point2D(x=float(i), y=float(i)), radius=1.0 + i,
+                   fill=Color.from_hex("#00FF00"))
+            for i in range(5)
+        ]
+        rect = Rectangle(x=0, y=0, width=5, height=5)
+        group = Group(name="batched", children=[*circles, rect])
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix=suffix, delete=False) as f:
+            filename = f.name
+
+        try:
+            save_drawable(group, filename, batch_children=True)
+
+            if suffix == ".json":
+                with open(filename, 'r') as f:
+                    data = json.load(f)
+
+                assert len(data["children"]) == 2
+                assert data["children"][0]["__batch__"] == "Circle"
+                assert data["children"][0]["radius"] == [1.0, 2.0, 3.0, 4.0, 5.0]
+                assert data["children"][1]["__type__"] == "Rectangle"
+
+            restored = load_drawable(filename)
+
+            assert restored == group
+
         finally:
             if os.path.exists(filename):
                 os.unlink(filename)
 
+    def test_msgpack_packs_transforms(self):
+        """Test that MessagePack files store transforms as packed doubles."""
+        msgpack = pytest.importorskip("msgpack")
+
+        original = Rectangle(
+            x=0, y=0, width=10, height=20,
+            transform=Transform2D(a=2.0, d=2.0, tx=10.0, ty=20.0),
+        )
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix=".mpk", delete=False) as f:
+            filename = f.name
+
+        try:
+            save_drawable(original, filename)
+
+            with open(filename, 'rb') as f:
+                raw = msgpack.unpackb(f.read(), raw=False)
+            assert isinstance(raw["transform"], msgpack.ExtType)
+            assert len(raw["transform"].data) == 48
+
+            restored = load_drawable(filename)
+            assert restored == original
+            assert isinstance(restored.transform, Transform2D)
+            assert restored.transform.tx == 10.0
+
+        finally:
+            os.unlink(filename)
+
+
+class TestBatchedChildren:
+    """Test cases for columnar batching of same-type children."""
+
+    def test_short_runs_are_not_batched(self):
+        """Test that runs below the threshold stay as individual objects."""
+        group = Group(children=[
+            Circle(center=Point2D(x=0, y=0), radius=1.0) for _ in range(3)
+        ])
+
+        data = json.loads(serialize_drawable(group, batch_children=True))
+
+        assert all("__type__" in child for child in data["children"])
+
+    def test_batched_round_trip_with_references(self):
+        """Test that batched output also loads with reference support."""
+        group = Group(children=[
+            Line(start=Point2D(x=0, y=i), end=Point2D(x=10, y=i)) for i in range(4)
+        ])
+
+        json_str = serialize_drawable(group, batch_children=True)
+
+        assert deserialize_drawable(json_str) == group
+        assert deserialize_with_references(json_str) == group
+
 
 class TestPolymorphicDeserialization:
     """Test cases for polymorphic deserialization."""
@@ -454,6 +654,49 @@ class TestEnhancedMethods:
         assert enhanced_dict["x"] == 5
         assert enhanced_dict["width"] == 20
 
+    def test_enhanced_dict_tracks_nested_changes(self):
+        """Test that each call returns a fresh dict of the current values."""
+        circle = Circle(center=Point2D(x=10, y=20), radius=15)
+
+        first = circle.to_dict_enhanced()
+        first["radius"] = 0
+        circle.center.x = 50
+
+        second = circle.to_dict_enhanced()
+        assert second is not first
+        assert second["radius"] == 15
+        assert second["center"]["x"] == 50
+        assert "__version__" not in circle.to_dict_enhanced(include_version=False)
+
+    def test_enhanced_json_honours_include_version(self):
+        """Test that to_json_enhanced passes include_version through."""
+        circle = Circle(center=Point2D(x=10, y=20), radius=15)
+
+        data = json.loads(circle.to_json_enhanced(include_version=False))
+
+        assert "__version__" not in data
+        assert data["__type__"] == "Circle"
+
+    def test_enhanced_json_accepts_encoder_options(self):
+        """Test that to_json_enhanced takes the same options as serialize_drawable."""
+        circles = [Circle(center=Point2D(x=i, y=i), radius=1) for i in range(4)]
+        group = Group(children=circles)
+
+        output = group.to_json_enhanced(batch_children=True, indent=2)
+
+        assert output == serialize_drawable(group, batch_children=True, indent=2)
+        assert deserialize_drawable(output) == group
+
+    def test_enhanced_json_references_shared_children(self):
+        """Test that a child appearing twice is written once and referenced."""
+        circle = Circle(center=Point2D(x=0, y=0), radius=1)
+        group = Group(children=[circle, circle])
+
+        data = json.loads(group.to_json_enhanced())
+
+        first, second = data["children"]
+        assert second == {"__ref__": first["__id__"]}
+
 
 class TestRegistryIntegration:
     """Test cases for type registry integration."""
@@ -474,4 +717,51 @@ class TestRegistryIntegration:
         assert get_type_discriminator(circle) == "Circle"
         
         rect = Rectangle(x=0, y=0, width=10, height=10)
-        assert get_type_discriminator(rect) == "Rectangle"
\ No newline at end of file
+        assert get_type_discriminator(rect) == "Rectangle"
+
+
+class TestPointArrays:
+    """Test cases for packed point-array encoding."""
+
+    def test_point_array_round_trip(self):
+        """Test that a point array survives encode and decode."""
+        np = pytest.importorskip("numpy")
+        from claude_draw.serialization import _decode_point_array
+
+        points = np.array([[0.0, 1.0], [2.5, -3.0], [4.0, 5.0]])
+
+        data = json.loads(json.dumps(points, cls=EnhancedJSONEncoder))
+
+        assert data == {"__type__": "Point2DArray", "xy": [0.0, 1.0, 2.5, -3.0, 4.0, 5.0]}
+        assert np.array_equal(_decode_point_array(data), points)
+
+    @pytest.mark.parametrize("shape", [(6,), (3, 3), (2, 2, 2)])
+    def test_non_point_arrays_rejected(self, shape):
+        """Test that only (N, 2) arrays are encoded as point arrays."""
+        np = pytest.importorskip("numpy")
+
+        with pytest.raises(TypeError):
+            json.dumps(np.zeros(shape), cls=EnhancedJSONEncoder)
+
+    def test_point_array_msgpack_round_trip(self):
+        """Test that point arrays are packed as a MessagePack extension."""
+        np = pytest.importorskip("numpy")
+        msgpack = pytest.importorskip("msgpack")
+        from claude_draw.serialization import _msgpack_default, _msgpack_ext_hook
+
+        points = np.array([[0.0, 1.0], [2.5, -3.0]])
+
+        packed = msgpack.packb({"points": points}, default=_msgpack_default)
+        decoded = msgpack.unpackb(packed, ext_hook=_msgpack_ext_hook)["points"]
+
+        assert decoded.dtype == np.float64
+        assert np.array_equal(decoded, points)
+
+    def test_unsupported_msgpack_value_rejected(self):
+        """Test that values without a MessagePack encoding fail clearly."""
+        np = pytest.importorskip("numpy")
+        msgpack = pytest.importorskip("msgpack")
+        from claude_draw.serialization import _msgpack_default
+
+        with pytest.raises(TypeError, match="cannot be stored in a MessagePack"):
+            msgpack.packb(np.zeros(6), default=_msgpack_default)
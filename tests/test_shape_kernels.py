@@ -0,0 +1,41 @@
+"""Tests for the scalar geometry kernels."""
+
+import math
+
+from claude_draw._shape_kernels import (
+    circle_contains,
+    ellipse_contains,
+    ellipse_perimeter,
+    rectangle_contains,
+    segment_length,
+)
+
+
+class TestShapeKernels:
+    """Test cases for the float-only geometry kernels."""
+
+    def test_circle_contains(self):
+        """Test circle containment including the boundary."""
+        assert circle_contains(0.0, 0.0, 5.0, 3.0, 4.0)
+        assert circle_contains(1.0, 1.0, 1.0, 1.0, 1.0)
+        assert not circle_contains(0.0, 0.0, 5.0, 4.0, 4.0)
+
+    def test_ellipse_contains(self):
+        """Test ellipse containment on both axes."""
+        assert ellipse_contains(0.0, 0.0, 5.0, 3.0, 5.0, 0.0)
+        assert ellipse_contains(0.0, 0.0, 5.0, 3.0, 0.0, -3.0)
+        assert not ellipse_contains(0.0, 0.0, 5.0, 3.0, 0.0, 3.5)
+
+    def test_rectangle_contains(self):
+        """Test rectangle containment including the edges."""
+        assert rectangle_contains(0.0, 0.0, 10.0, 5.0, 10.0, 5.0)
+        assert rectangle_contains(0.0, 0.0, 10.0, 5.0, 3.0, 2.0)
+        assert not rectangle_contains(0.0, 0.0, 10.0, 5.0, 10.5, 2.0)
+
+    def test_ellipse_perimeter_of_circle(self):
+        """Test that equal radii give the circle circumference."""
+        assert math.isclose(ellipse_perimeter(5.0, 5.0), 2 * math.pi * 5.0)
+
+    def test_segment_length(self):
+        """Test segment length for a 3-4-5 triangle."""
+        assert segment_length(1.0, 1.0, 4.0, 5.0) == 5.0
@@ -10,6 +10,22 @@ from claude_draw.models.bounding_box import BoundingBox
 from claude_draw.models.color import Color
 
 
+class _MockVisitor:
+    """Visitor shared by the visitor-pattern tests; returns a tag per shape."""
+    
+    def visit_circle(self, circle):
+        return f"visited_circle_{circle.radius}"
+    
+    def visit_rectangle(self, rectangle):
+        return f"visited_rectangle_{rectangle.width}x{rectangle.height}"
+    
+    def visit_ellipse(self, ellipse):
+        return f"visited_ellipse_{ellipse.rx}x{ellipse.ry}"
+    
+    def visit_line(self, line):
+        return f"visited_line_{line.length()}"
+
+
 class TestCircle:
     """Test cases for Circle shape."""
     
@@ -67,6 +83,49 @@ class TestCircle:
         
         assert bounds == expected
     
+    def test_circle_bounds_overflow(self):
+        """Test that bounds which overflow to infinity are rejected."""
+        circle = Circle(center=Point2D(x=0, y=0), radius=1e308)
+        
+        with pytest.raises(ValueError):
+            circle.get_bounds()
+    
+    def test_circle_bounds_fresh(self):
+        """Test that bounds track nested mutation and are never shared."""
+        circle = Circle(center=Point2D(x=10, y=20), radius=5.0)
+        
+        # Each call returns an independent box
+        bounds = circle.get_bounds()
+        assert bounds is not circle.get_bounds()
+        bounds.x = 100
+        assert circle.get_bounds().x == 5
+        
+        # Copies with new geometry compute their own bounds
+        bigger = circle.with_radius(10.0)
+        assert bigger.get_bounds() == BoundingBox(x=0, y=10, width=20, height=20)
+        moved = circle.with_center(Point2D(x=0, y=0))
+        assert moved.get_bounds() == BoundingBox(x=-5, y=-5, width=10, height=10)
+        
+        # Bounds do not leak into equality or serialization
+        assert circle == circle.model_copy()
+        assert "bounds" not in circle.model_dump()
+        
+        # Mutating the nested center is reflected on the next call
+        circle.center.x = 50
+        assert circle.get_bounds() == BoundingBox(x=45, y=15, width=10, height=10)
+    
+    def test_shape_extents(self):
+        """Test (min_x, min_y, max_x, max_y) extents of each shape."""
+        assert Circle(center=Point2D(x=10, y=20), radius=5).extents == (5, 15, 15, 25)
+        assert Rectangle(x=1, y=2, width=3, height=4).extents == (1, 2, 4, 6)
+        assert Ellipse(center=Point2D(x=0, y=0), rx=4, ry=2).extents == (-4, -2, 4, 2)
+        line = Line(start=Point2D(x=5, y=-1), end=Point2D(x=-3, y=7))
+        assert line.extents == (-3, -1, 5, 7)
+        
+        # Extents follow in-place edits of the nested endpoints
+        line.start.x = -10
+        assert line.extents == (-10, -1, -3, 7)
+    
     def test_circle_with_center(self):
         """Test circle center modification."""
         circle = Circle(center=Point2D(x=0, y=0), radius=5.0)
@@ -93,6 +152,10 @@ class TestCircle:
         # New circle has new radius
         assert new_circle.radius == 10.0
         assert new_circle.center == Point2D(x=0, y=0)
+        
+        # Invalid radii are rejected just like at construction
+        with pytest.raises(ValidationError):
+            circle.with_radius(-1.0)
     
     def test_circle_contains_point(self):
         """Test circle point containment."""
@@ -140,16 +203,14 @@ class TestCircle:
         # Invalid scale factor
         with pytest.raises(ValueError):
             circle.scaled(-1.0)
+        with pytest.raises(ValueError):
+            circle.scaled(float("nan"))
     
     def test_circle_visitor_pattern(self):
         """Test circle visitor pattern."""
         circle = Circle(center=Point2D(x=0, y=0), radius=5.0)
         
-        class MockVisitor:
-            def visit_circle(self, circle):
-                return f"visited_circle_{circle.radius}"
-        
-        visitor = MockVisitor()
+        visitor = _MockVisitor()
         result = circle.accept(visitor)
         
         assert result == "visited_circle_5.0"
@@ -241,6 +302,9 @@ class TestRectangle:
         assert new_rect.height == 200
         assert new_rect.x == 10
         assert new_rect.y == 20
+        
+        with pytest.raises(ValidationError):
+            rect.with_size(0, 200)
     
     def test_rectangle_contains_point(self):
         """Test rectangle point containment."""
@@ -282,11 +346,7 @@ class TestRectangle:
         """Test rectangle visitor pattern."""
         rect = Rectangle(x=10, y=20, width=30, height=40)
         
-        class MockVisitor:
-            def visit_rectangle(self, rectangle):
-                return f"visited_rectangle_{rectangle.width}x{rectangle.height}"
-        
-        visitor = MockVisitor()
+        visitor = _MockVisitor()
         result = rect.accept(visitor)
         
         assert result == "visited_rectangle_30.0x40.0"
@@ -368,6 +428,9 @@ class TestEllipse:
         assert new_ellipse.rx == 10.0
         assert new_ellipse.ry == 8.0
         assert new_ellipse.center == Point2D(x=0, y=0)
+        
+        with pytest.raises(ValidationError):
+            ellipse.with_radii(10.0, -8.0)
     
     def test_ellipse_contains_point(self):
         """Test ellipse point containment."""
@@ -434,16 +497,15 @@ class TestEllipse:
         
         with pytest.raises(ValueError):
             ellipse.scaled(2.0, -1.0)
+        
+        with pytest.raises(ValueError):
+            ellipse.scaled(float("nan"), 1.0)
     
     def test_ellipse_visitor_pattern(self):
         """Test ellipse visitor pattern."""
         ellipse = Ellipse(center=Point2D(x=0, y=0), rx=5.0, ry=3.0)
         
-        class MockVisitor:
-            def visit_ellipse(self, ellipse):
-                return f"visited_ellipse_{ellipse.rx}x{ellipse.ry}"
-        
-        visitor = MockVisitor()
+        visitor = _MockVisitor()
         result = ellipse.accept(visitor)
         
         assert result == "visited_ellipse_5.0x3.0"
@@ -566,21 +628,58 @@ class TestLine:
         point = Line(start=Point2D(x=5, y=5), end=Point2D(x=5, y=5))
         assert point.is_point()
     
+    def test_line_delta(self):
+        """Test that the direction vector follows the current endpoints."""
+        line = Line(start=Point2D(x=1, y=2), end=Point2D(x=4, y=6))
+        assert line.delta == (3.0, 4.0)
+        
+        moved = line.with_end(Point2D(x=1, y=10))
+        assert moved.delta == (0.0, 8.0)
+        assert moved.is_vertical()
+        assert line.length() == 5.0
+        
+        # Mutating a nested endpoint is reflected immediately
+        line.end.x = 1
+        assert line.delta == (0.0, 4.0)
+        assert line.length() == 4.0
+        assert line.is_vertical()
+    
     def test_line_visitor_pattern(self):
         """Test line visitor pattern."""
         line = Line(start=Point2D(x=0, y=0), end=Point2D(x=10, y=10))
         
-        class MockVisitor:
-            def visit_line(self, line):
-                return f"visited_line_{line.length()}"
-        
-        visitor = MockVisitor()
+        visitor = _MockVisitor()
         result = line.accept(visitor)
         
         expected_length = math.sqrt(200)  # sqrt(10² + 10²)
         assert result == f"visited_line_{expected_length}"
 
 
+class TestVectorizedContains:
+    """Test the array-based contains_points methods against contains_point."""
+
+    @pytest.mark.parametrize("shape", [
+        Circle(center=Point2D(x=5, y=-5), radius=40),
+        Rectangle(x=-20, y=10, width=60, height=30),
+        Ellipse(center=Point2D(x=0, y=0), rx=50, ry=20),
+    ])
+    def test_contains_points_matches_scalar(self, shape):
+        """Test that the vectorized mask agrees with per-point checks."""
+        np = pytest.importorskip("numpy")
+        rng = np.random.default_rng(0)
+        xs = rng.uniform(-100, 100, 10_000)
+        ys = rng.uniform(-100, 100, 10_000)
+
+        mask = shape.contains_points(xs, ys)
+
+        assert mask.shape == (10_000,)
+        assert mask.dtype == bool
+        expected = [shape.contains_point(Point2D(x=float(x), y=float(y)))
+                    for x, y in zip(xs, ys)]
+        assert mask.tolist() == expected
+        assert 0 < mask.sum() < 10_000
+
+
 class TestShapeImmutability:
     """Test immutability of all shape classes."""
     
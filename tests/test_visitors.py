@@ -1,5 +1,8 @@
 """Tests for visitor pattern implementation."""
 
+import math
+import re
+
 import pytest
 from claude_draw.visitors import RenderContext, RenderState, BaseRenderer
 from claude_draw.renderers import SVGRenderer, BoundingBoxCalculator
@@ -10,6 +13,10 @@ from claude_draw.models.color import Color
 from claude_draw.models.transform import Transform2D
 
 
+# Element openings and attribute assignments in rendered SVG
+_SVG_TOKENS = re.compile(r'<[a-z]+|[a-z-]+="[^"]*"')
+
+
 class TestRenderContext:
     """Test cases for RenderContext."""
     
@@ -55,6 +62,65 @@ class TestRenderContext:
         context.pop_transform()
         assert context.current_transform.is_identity()
     
+    def test_transform_composition_reuse(self):
+        """Test that identity pushes and repeated products reuse matrices."""
+        context = RenderContext()
+        base = context.current_transform
+        
+        context.push_transform(Transform2D())
+        assert context.current_transform is base
+        context.pop_transform()
+        
+        translate = Transform2D().translate(5, 6)
+        context.push_transform(translate)
+        first = context.current_transform
+        context.pop_transform()
+        
+        # An equal but distinct transform hits the same cached product
+        context.push_transform(Transform2D().translate(5, 6))
+        assert context.current_transform is first
+        assert (first.tx, first.ty) == (5.0, 6.0)
+        
+        # A different transform composes normally
+        context.pop_transform()
+        context.push_transform(Transform2D().translate(7, 8))
+        assert context.current_transform is not first
+        assert (context.current_transform.tx, context.current_transform.ty) == (7.0, 8.0)
+
+    def test_cached_transforms_are_read_only(self):
+        """Test that shared stack matrices cannot be corrupted by callers."""
+        context = RenderContext()
+        context.push_transform(Transform2D().translate(5, 6))
+
+        with pytest.raises(ValueError):
+            context.current_transform.tx = 0
+        with pytest.raises(ValueError):
+            RenderContext().current_transform.tx = 1
+
+        # The memoized product is unchanged for the next push
+        context.pop_transform()
+        context.push_transform(Transform2D().translate(5, 6))
+        assert context.current_transform == Transform2D().translate(5, 6)
+
+    def test_transform_composition_matches_multiply(self):
+        """Test that stacked products equal Transform2D multiplication."""
+        context = RenderContext()
+        outer = Transform2D.rotate(0.3).translate_by(4, -2)
+        inner = Transform2D.scale_transform(2, 3).skew_by(0.1, 0.2)
+
+        context.push_transform(outer)
+        context.push_transform(inner)
+
+        assert context.current_transform.model_dump() == (outer * inner).model_dump()
+
+    def test_transform_composition_overflow(self):
+        """Test that an overflowing product is rejected like multiplication."""
+        context = RenderContext()
+        context.push_transform(Transform2D.scale_transform(1e200))
+
+        with pytest.raises(ValueError):
+            context.push_transform(Transform2D.scale_transform(1e200))
+
     def test_state_stack(self):
         """Test rendering state stack operations."""
         context = RenderContext()
@@ -103,6 +169,30 @@ class TestRenderContext:
         
         with pytest.raises(ValueError, match="Cannot pop base"):
             context.pop_state()
+        assert context.get_effective_opacity() == 1.0
+    
+    def test_effective_opacity_deep_nesting(self):
+        """Test the running opacity product across many nested states."""
+        context = RenderContext()
+        for _ in range(10):
+            context.push_state(opacity=0.5)
+        assert context.get_effective_opacity() == 0.5 ** 10
+        
+        for _ in range(10):
+            context.pop_state()
+        assert context.get_effective_opacity() == 1.0
+    
+    def test_effective_opacity_snapshots_pushed_state(self):
+        """Test that opacity is captured when a state is pushed."""
+        context = RenderContext()
+        context.push_state(opacity=0.5)
+        
+        # Documented: later edits to a pushed state are not seen
+        context.current_state.opacity = 0.1
+        assert context.get_effective_opacity() == 0.5
+        
+        context.push_state(opacity=0.1)
+        assert context.get_effective_opacity() == 0.05
 
 
 class TestSVGRenderer:
@@ -134,13 +224,26 @@ class TestSVGRenderer:
         
         output = renderer.render(circle)
         
-        assert '<circle' in output
-        assert 'cx="50.000" cy="50.000"' in output
-        assert 'r="25.000"' in output
-        assert 'fill="#FF0000"' in output
-        assert 'stroke="#000000"' in output
-        assert 'stroke-width="2.0"' in output
-    
+        found = set(_SVG_TOKENS.findall(output))
+        assert {
+            '<circle',
+            'cx="50.000"',
+            'cy="50.000"',
+            'r="25.000"',
+            'fill="#FF0000"',
+            'stroke="#000000"',
+            'stroke-width="2.0"',
+        } <= found
+
+    def test_unpainted_shape_rendering(self):
+        """Test that shapes without fill or stroke say so explicitly."""
+        renderer = SVGRenderer()
+        circle = Circle(center=Point2D(x=5, y=5), radius=1)
+
+        output = renderer.render(circle)
+
+        assert 'fill="none" stroke="none"/>' in output
+
     def test_rectangle_rendering(self):
         """Test rectangle SVG generation."""
         renderer = SVGRenderer()
@@ -151,10 +254,15 @@ class TestSVGRenderer:
         
         output = renderer.render(rect)
         
-        assert '<rect' in output
-        assert 'x="10.000" y="20.000"' in output
-        assert 'width="30.000" height="40.000"' in output
-        assert 'fill="#00FF00"' in output
+        found = set(_SVG_TOKENS.findall(output))
+        assert {
+            '<rect',
+            'x="10.000"',
+            'y="20.000"',
+            'width="30.000"',
+            'height="40.000"',
+            'fill="#00FF00"',
+        } <= found
     
     def test_group_rendering(self):
         """Test group SVG generation with children."""
@@ -214,13 +322,141 @@ class TestSVGRenderer:
         # Should include transform attribute
         assert 'transform="matrix(' in output
 
+    def test_transform_attribute_formatting(self):
+        """Test that matrices keep full precision and identity is omitted."""
+        renderer = SVGRenderer()
+        group = Group().add_child(Circle(center=Point2D(x=0, y=0), radius=1))
+
+        output = renderer.render(group)
+        assert '<g>' in output
+        assert 'transform=' not in output
+
+        output = renderer.render(group.translate(1, 2))
+        assert '<g transform="matrix(1.0,0.0,0.0,1.0,1.0,2.0)">' in output
+
+        # Coefficients are not rounded to the coordinate precision
+        output = SVGRenderer(precision=1).render(group.rotate(0.3))
+        assert f'<g transform="matrix({math.cos(0.3)!r},{math.sin(0.3)!r},' in output
+        assert 'r="1.0"' in output
+
+    def test_shared_paint_hoisted(self):
+        """Test that consecutive shapes with one paint share a <g>."""
+        renderer = SVGRenderer()
+        red = Color.from_hex("#FF0000")
+        group = (
+            Group()
+            .add_child(Circle(center=Point2D(x=1, y=1), radius=1, fill=red))
+            .add_child(Rectangle(x=0, y=0, width=2, height=2, fill=red, opacity=0.5))
+            .add_child(Circle(center=Point2D(x=3, y=3), radius=1))
+        )
+
+        output = renderer.render(group)
+
+        assert (
+            '<g fill="#FF0000" stroke="none">\n'
+            '<circle cx="1.000" cy="1.000" r="1.000"/>\n'
+            '<rect x="0.000" y="0.000" width="2.000" height="2.000" opacity="0.500"/>\n'
+            '</g>\n'
+            '<circle cx="3.000" cy="3.000" r="1.000" fill="none" stroke="none"/>\n'
+        ) in output
+        assert ' />' not in output
+        assert ' >' not in output
+
+    def test_single_shape_paint_not_hoisted(self):
+        """Test that shapes with distinct paint keep their own attributes."""
+        renderer = SVGRenderer()
+        group = (
+            Group()
+            .add_child(Circle(center=Point2D(x=1, y=1), radius=1, fill=Color.from_hex("#FF0000")))
+            .add_child(Circle(center=Point2D(x=2, y=2), radius=1, fill=Color.from_hex("#00FF00")))
+        )
+
+        output = renderer.render(group)
+
+        assert output.count('<g') == 1
+        assert 'r="1.000" fill="#FF0000" stroke="none"/>' in output
+        assert 'r="1.000" fill="#00FF00" stroke="none"/>' in output
+
+    def test_hoisting_preserves_child_order(self):
+        """Test that shapes around hoisted runs keep their document order."""
+        renderer = SVGRenderer()
+        red = Color.from_hex("#FF0000")
+        group = (
+            Group()
+            .add_child(Circle(center=Point2D(x=0, y=0), radius=1))
+            .add_child(Group(name="inner"))
+            .add_child(Circle(center=Point2D(x=1, y=1), radius=1, fill=red))
+            .add_child(Circle(center=Point2D(x=2, y=2), radius=1, fill=red))
+            .add_child(Circle(center=Point2D(x=3, y=3), radius=1))
+        )
+
+        output = renderer.render(group)
+
+        cxs = re.findall(r'<circle cx="(\d)', output)
+        assert cxs == ["0", "1", "2", "3"]
+        assert output.index('id="inner"') < output.index('<g fill="#FF0000"')
+        assert output.count('fill="#FF0000"') == 1
+
+    def test_hidden_layer_restores_transform(self):
+        """Test that skipping a hidden layer pops its transform."""
+        renderer = SVGRenderer()
+        layer = Layer(name="hidden", visible=False).translate(5, 5)
+
+        renderer.visit_layer(layer)
+
+        assert renderer.context.current_transform.is_identity()
+
+    def test_minified_output(self):
+        """Test that minify drops line breaks and nothing else."""
+        layer = Layer(name="shapes", opacity=0.5).add_child(
+            Group(name="g")
+            .add_child(Circle(center=Point2D(x=1, y=1), radius=1))
+            .add_child(Rectangle(x=0, y=0, width=2, height=2))
+        )
+        drawing = Drawing(width=20, height=10, background_color="#FFFFFF").add_child(layer)
+
+        pretty = SVGRenderer().render(drawing)
+        minified = SVGRenderer(minify=True).render(drawing)
+
+        assert "\n" not in minified
+        assert minified == pretty.replace("\n", "")
+        assert minified.endswith('</defs></svg>')
+
+    def test_coordinate_precision(self):
+        """Test configurable coordinate precision."""
+        circle = Circle(center=Point2D(x=1.23456, y=-0.0), radius=2.5,
+                        opacity=0.5)
+        
+        output = SVGRenderer(precision=1).render(circle)
+        assert 'cx="1.2" cy="0.0" r="2.5"' in output
+        # Opacity keeps its fixed three decimals
+        assert 'opacity="0.500"' in output
+        
+        output = SVGRenderer(precision=0).render(circle)
+        assert 'cx="1" cy="0" r="2"' in output
+        
+        with pytest.raises(ValueError):
+            SVGRenderer(precision=-1)
+
+
+@pytest.fixture(scope="module")
+def shared_calculator():
+    """One bounding box calculator reused by the calculator tests."""
+    return BoundingBoxCalculator()
+
+
+@pytest.fixture
+def calculator(shared_calculator):
+    """The shared bounding box calculator, reset for each test."""
+    shared_calculator.reset()
+    return shared_calculator
+
 
 class TestBoundingBoxCalculator:
     """Test cases for bounding box calculator."""
     
-    def test_circle_bounds(self):
+    def test_circle_bounds(self, calculator):
         """Test bounding box calculation for circle."""
-        calculator = BoundingBoxCalculator()
         circle = Circle(center=Point2D(x=50, y=50), radius=25)
         
         calculator.render(circle)
@@ -233,9 +469,8 @@ class TestBoundingBoxCalculator:
         assert width == 50  # 2 * 25
         assert height == 50  # 2 * 25
     
-    def test_rectangle_bounds(self):
+    def test_rectangle_bounds(self, calculator):
         """Test bounding box calculation for rectangle."""
-        calculator = BoundingBoxCalculator()
         rect = Rectangle(x=10, y=20, width=30, height=40)
         
         calculator.render(rect)
@@ -248,9 +483,8 @@ class TestBoundingBoxCalculator:
         assert width == 30
         assert height == 40
     
-    def test_group_bounds(self):
+    def test_group_bounds(self, calculator):
         """Test bounding box calculation for group of shapes."""
-        calculator = BoundingBoxCalculator()
         
         circle = Circle(center=Point2D(x=0, y=0), radius=10)  # bounds: -10 to 10
         rect = Rectangle(x=20, y=30, width=40, height=50)  # bounds: 20-60, 30-80
@@ -267,16 +501,68 @@ class TestBoundingBoxCalculator:
         assert width == 70  # from -10 to 60
         assert height == 90  # from -10 to 80
     
-    def test_empty_bounds(self):
-        """Test bounding box calculation with no shapes."""
+    def test_mirrored_group_bounds(self):
+        """Test bounds under a scale-and-translate group transform."""
         calculator = BoundingBoxCalculator()
+        
+        rect = Rectangle(x=1, y=2, width=3, height=4)  # corners (1,2)-(4,6)
+        line = Line(start=Point2D(x=0, y=0), end=Point2D(x=2, y=-2))
+        mirror = Transform2D(a=-2.0, d=1.0, tx=10.0, ty=5.0)
+        group = Group(children=[rect, line], transform=mirror)
+        
+        calculator.render(group)
+        
+        # x maps to 10 - 2x, y maps to y + 5
+        assert calculator.get_bounding_box() == (2.0, 3.0, 8.0, 8.0)
+    
+    @pytest.mark.parametrize("transform", [
+        Transform2D(),
+        Transform2D(a=-2.0, d=0.5, tx=3.0, ty=-7.0),
+        Transform2D().rotate(0.4),
+    ])
+    def test_large_group_bounds_vectorized(self, transform, monkeypatch):
+        """Test that the NumPy path for large groups matches per-shape visits."""
+        pytest.importorskip("numpy")
+        import claude_draw.renderers as renderers
+        
+        children = []
+        for i in range(40):
+            children.append(Circle(center=Point2D(x=i * 1.5, y=-i), radius=1 + i % 3))
+            children.append(Rectangle(x=-i, y=i * 0.5, width=2, height=3))
+            children.append(Ellipse(center=Point2D(x=i, y=i), rx=2, ry=0.5))
+            children.append(Line(start=Point2D(x=i, y=0), end=Point2D(x=0, y=-i)))
+        group = Group(children=children, transform=transform)
+        
+        def bounds():
+            calculator = BoundingBoxCalculator()
+            calculator.render(group)
+            return calculator.get_bounding_box()
+        
+        vectorized = bounds()
+        monkeypatch.setattr(renderers, "np", None)
+        assert vectorized == bounds()
+        assert all(type(value) is float for value in vectorized)
+    
+    def test_empty_bounds(self, calculator):
+        """Test bounding box calculation with no shapes."""
         empty_group = Group()
         
         calculator.render(empty_group)
         bounds = calculator.get_bounding_box()
-        
+
         assert bounds is None
 
+    def test_reset(self, calculator):
+        """Test that reset clears bounds and unwinds the context."""
+        calculator.visit_circle(Circle(center=Point2D(x=0, y=0), radius=1))
+        calculator.context.push(transform=Transform2D().translate(1, 2), opacity=0.5)
+
+        calculator.reset()
+
+        assert calculator.get_bounding_box() is None
+        assert calculator.context.current_transform.is_identity()
+        assert calculator.context.get_effective_opacity() == 1.0
+
 
 class MockRenderer(BaseRenderer):
     """Mock renderer for testing base functionality."""
@@ -356,4 +642,18 @@ class TestBaseRenderer:
         assert any("circle_1" in call for call in all_calls)
         assert any("rect_2x3" in call for call in all_calls)
         assert any("line" in call for call in all_calls)
-        assert any("ellipse_4x5" in call for call in all_calls)
\ No newline at end of file
+        assert any("ellipse_4x5" in call for call in all_calls)
+    
+    def test_subclass_accept_is_honored(self):
+        """Test that shape subclasses overriding accept() still use it."""
+        class TaggedCircle(Circle):
+            def accept(self, visitor):
+                visitor.visit_calls.append("tagged")
+                return visitor.visit_circle(self)
+        
+        renderer = MockRenderer()
+        group = Group().add_child(TaggedCircle(center=Point2D(x=0, y=0), radius=3))
+        
+        renderer.render(group)
+        
+        assert renderer.visit_calls == ["begin", "tagged", "circle_3", "end"]